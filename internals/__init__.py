@@ -1,7 +1,7 @@
 """
 The main __init__ for the internals package.
 """
-from .logging_ import createLogger, SuppressedLoggerAdapter
-from .config import Config
+from .logging import createLogger, SuppressedLoggerAdapter
+from .config import Config, getConfig
 from .database import Database
 from .errors import *
@@ -2,24 +2,86 @@
 Contains the config for the project.
 """
 # Standard Imports
-from json import dump, load
 from pathlib import Path
-from os import environ
+from os import environ, fsync, replace
+from re import Pattern, compile as compileRegex, escape
 
 # Third Party Imports
 from dotenv import load_dotenv as loadDotEnv
 
+try:
+    from orjson import dumps, loads, OPT_INDENT_2
+    _orjsonInstalled: bool = True
+except ImportError:  # orjson is optional, fall back to the standard library json module
+    from json import dumps, loads
+    _orjsonInstalled: bool = False
+
 # Package Relative Imports
 from .logging import createLogger, SuppressedLoggerAdapter
 from .errors import InvalidStatusType
 
 
+def _serialiseJson(data: dict) -> bytes:
+    """
+    Serialises data to json. Both json backends produce the same output, so the config file does not change format
+    depending on whether orjson is installed.
+
+    Args:
+        data (dict): The data to serialise.
+
+    Returns:
+        bytes: The serialised data.
+    """
+    if _orjsonInstalled:
+        return dumps(data, option=OPT_INDENT_2)
+    return dumps(data, indent=2, ensure_ascii=False).encode()
+
+
+def _readJson(path: Path) -> dict:
+    """
+    Reads and parses a json file.
+
+    Args:
+        path (Path): The path to the json file.
+
+    Returns:
+        dict: The parsed json file.
+    """
+    return loads(path.read_bytes())
+
+
+def _writeJson(path: Path, data: dict) -> None:
+    """
+    Atomically writes data to a json file. The data is written and synced to a temporary file which then replaces the
+    original, so a crash mid-write can never leave a truncated file behind.
+
+    Args:
+        path (Path): The path to the json file.
+        data (dict): The data to write.
+
+    Returns:
+        None
+    """
+    temporaryPath: Path = path.with_suffix(".json.tmp")
+    with open(temporaryPath, 'wb') as file:
+        file.write(_serialiseJson(data))
+        file.flush()
+        fsync(file.fileno())
+
+    replace(temporaryPath, path)
+
+
+# The status types that can be set
+_validStatusTypes: frozenset[str] = frozenset({"playing", "watching", "listening", "streaming"})
+
+
 class Config:
     """
     The config class for the bot. This class is used to store the config values for the bot.
     """
     # Type Hints
     _configFilePath: Path
+    _data: dict[str, str | int | bool | list[str | int]]
     logger: SuppressedLoggerAdapter
 
     dbIp: str
@@ -28,7 +90,11 @@ class Config:
     dbUser: str
     dbPassword: str
     debug: bool = False
-    owonerId: str
+    owonerId: frozenset[int]
+    _token: str
+    _dirty: bool = False
+    _gifClassifiers: frozenset[str]
+    _gifClassifierPattern: Pattern[str] | None
 
     def __init__(
             self,
@@ -50,6 +116,10 @@ class Config:
         self.logger = createLogger("Config")
         self.logger.info("Initializing config")
 
+        # Load the config file once, all reads are served from memory and writes go through setValue
+        self._data = _readJson(self._configFilePath)
+        self._loadGifClassifiers()
+
         # Load the environment variables
         loadDotEnv(dotenv_path=envFile)
 
@@ -60,7 +130,8 @@ class Config:
         self.dbUser = environ.get("DB_USER")
         self.dbPassword = environ.get("DB_PASS")
         self.debug = environ.get("DEBUG") == "True"
-        self.owonerId = environ.get("OWNER_ID")
+        self.owonerId = frozenset(int(ownerId) for ownerId in environ.get("OWNER_ID", "").split(",") if ownerId)
+        self._token = environ.get("DEBUG_TOKEN" if self.debug else "TOKEN")
 
     """
 ========================================================================================================================
@@ -75,9 +146,7 @@ class Config:
         Returns:
             str: The bot token.
         """
-        if self.debug:
-            return environ.get("DEBUG_TOKEN")
-        return environ.get("TOKEN")
+        return self._token
 
     """
 ========================================================================================================================
@@ -106,7 +175,7 @@ class Config:
         Returns:
             None
         """
-        self.logger.debug(f"Setting status to '{value}'")
+        self.logger.debug("Setting status to '%s'", value)
         self.setValue("status", value)
 
     @property
@@ -133,22 +202,93 @@ class Config:
         Returns:
             None
         """
-        self.logger.debug(f"Attempting to set statusType to {value}")
-        if value not in ["playing", "watching", "listening", "streaming"]:
-            self.logger.error(f"Invalid status type '{value}'")
+        self.logger.debug("Attempting to set statusType to %s", value)
+        if value.lower() not in _validStatusTypes:
+            self.logger.error("Invalid status type '%s'", value)
             raise InvalidStatusType(value)
 
         self.setValue("statusType", value)
 
     @property
-    def gifClassifiers(self) -> list[str]:
+    def gifClassifiers(self) -> frozenset[str]:
         """
         Gets the gif classifiers.
 
         Returns:
-            list: The gif classifiers.
+            frozenset: The gif classifiers.
+        """
+        return self._gifClassifiers
+
+    @gifClassifiers.setter
+    def gifClassifiers(self, value: list[str]) -> None:
         """
-        return self.getJson("gifClassifiers")
+        Sets the gif classifiers.
+
+        Args:
+            value (list[str]): The gif classifiers.
+
+        Returns:
+            None
+        """
+        self.setValue("gifClassifiers", value)
+        self._loadGifClassifiers()
+
+    @property
+    def gifClassifierPattern(self) -> Pattern[str] | None:
+        """
+        Gets a single compiled pattern that matches any of the gif classifiers, so a message can be checked against all
+        of them in one scan.
+
+        Returns:
+            Pattern | None: The gif classifier pattern, or None if there are no gif classifiers.
+        """
+        return self._gifClassifierPattern
+
+    @property
+    def filterEnabled(self) -> bool:
+        """
+        Gets whether the gif filter is enabled.
+
+        Returns:
+            bool: Whether the gif filter is enabled.
+        """
+        return self.getJson("filterEnabled")
+
+    @filterEnabled.setter
+    def filterEnabled(self, value: bool) -> None:
+        """
+        Sets whether the gif filter is enabled.
+
+        Args:
+            value (bool): Whether the gif filter is enabled.
+
+        Returns:
+            None
+        """
+        self.setValue("filterEnabled", value)
+
+    @property
+    def loggingLevel(self) -> str:
+        """
+        Gets the logging level.
+
+        Returns:
+            str: The logging level.
+        """
+        return self.getJson("loggingLevel")
+
+    def _loadGifClassifiers(self) -> None:
+        """
+        Loads the gif classifiers from the config data and compiles the gif classifier pattern.
+
+        Returns:
+            None
+        """
+        self._gifClassifiers = frozenset(self._data["gifClassifiers"])
+        if self._gifClassifiers:
+            self._gifClassifierPattern = compileRegex("|".join(map(escape, self._gifClassifiers)))
+        else:
+            self._gifClassifierPattern = None
 
     def getJson(self, key) -> str | int | bool | list[str | int]:
         """
@@ -159,27 +299,66 @@ class Config:
         Returns:
             The value of the key.
         """
-        with open(self._configFilePath, 'r') as file:
-            configData: dict[str, str | int | bool | list[str]] = load(file)
-
-        try:
-            self.logger.debug(f"Getting value for key '{key}'")
-        except AttributeError:
-            pass
-        return configData[key]
+        self.logger.debug("Getting value for key '%s'", key)
+        return self._data[key]
 
     def setValue(self, key: str, value: str | int | bool | list[str | int]):
         """
-        Writes a new value to the config file.
+        Sets a new value in the config. The config file is only written on the next flush.
         Args:
             key(str): The key of the value to write.
             value: The value to write.
         """
-        self.logger.debug(f"Writing new value for key '{key}': {value}")
-        with open(self._configFilePath, 'r') as file:
-            configData: dict[str, str | int | bool | list[str]] = load(file)
+        self.logger.debug("Setting new value for key '%s': %s", key, value)
+        self._data[key] = value
+        self._dirty = True
+
+    @property
+    def dirty(self) -> bool:
+        """
+        Gets whether the config has changes that have not been written to the config file yet.
+
+        Returns:
+            bool: Whether the config has unwritten changes.
+        """
+        return self._dirty
+
+    def flush(self) -> None:
+        """
+        Writes the config to the config file if it has changed since the last flush.
+
+        Returns:
+            None
+        """
+        if not self._dirty:
+            return
+
+        self.logger.debug("Writing config file")
+        _writeJson(self._configFilePath, self._data)
+        # Only cleared once the write succeeds, so a failed write is retried by the next flush
+        self._dirty = False
+
 
-        configData[key] = value
+# The process-wide config, created by the first call to getConfig
+_config: Config | None = None
 
-        with open(self._configFilePath, 'w') as file:
-            dump(configData, file, indent=4)
+
+def getConfig(
+        configJson: Path = Path("BotData/config.json"),
+        envFile: Path = Path("BotData/.env")
+) -> Config:
+    """
+    Gets the process-wide config, creating it on the first call. The paths are only used by the first call, later calls
+    return the same config whatever they are given.
+
+    Args:
+        configJson (Path): The path to the config file.
+        envFile (Path): The path to the environment file.
+
+    Returns:
+        Config: The config.
+    """
+    global _config
+    if _config is None:
+        _config = Config(configJson, envFile)
+    return _config
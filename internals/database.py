@@ -24,6 +24,7 @@ class Database:
     _logger: SuppressedLoggerAdapter
     _config: Config
     _connection: Connection
+    _logConnection: Connection
 
     def __init__(
             self,
@@ -39,24 +40,36 @@ class Database:
             None
         """
         self._config = config
-        self._connection = connect(
-            dbname=config.dbName,
-            user=config.dbUser,
-            password=config.dbPassword,
-            host=config.dbIp,
-            port=config.dbPort
-        )
-        # Create the logger
+        self._connection = self._connect()
+        # Create the logger. The log handler commits its batches on its own thread, so it gets a connection of its own
+        # rather than sharing the one used for the application's transactions
+        self._logConnection = self._connect()
         self._logger = createLogger(
             "Database",
-            databaseConnection=self._connection
+            databaseConnection=self._logConnection
         )
 
     def __del__(self) -> None:
         """
-        Closes the database connection.
+        Closes the database connections.
         """
         self._connection.close()
+        self._logConnection.close()
+
+    def _connect(self) -> Connection:
+        """
+        Opens a new connection to the database.
+
+        Returns:
+            Connection: The new connection.
+        """
+        return connect(
+            dbname=self._config.dbName,
+            user=self._config.dbUser,
+            password=self._config.dbPassword,
+            host=self._config.dbIp,
+            port=self._config.dbPort
+        )
 
     """
 ===============================================================================================================================================================
@@ -88,16 +101,35 @@ OLD CODE
 The database module for the bot. This module is used to store the database values for the bot.
 """
 # Standard Library Imports
+from asyncio import get_running_loop
+from atexit import register as registerExitHandler
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+from functools import partial
 from pathlib import Path
+from re import Pattern, compile as compileRegex, escape
+from threading import Lock, RLock
+from typing import Any, Callable, Generator, NamedTuple
 
 # External imports
-from sqlite3 import connect, Connection, Cursor
+from sqlite3 import connect, Connection
+from cachetools import TTLCache
 from discord import Member, User
 
 # Internal imports
 from .config import Config
-from .logging_ import createLogger, SuppressedLoggerAdapter
+from .logging import createLogger, SuppressedLoggerAdapter
+
+
+class UserStats(NamedTuple):
+    """
+    The username and message counts of a user.
+    """
+    username: str
+    messagesSent: int
+    messagesDeleted: int
 
 
 class Database:
@@ -108,16 +140,142 @@ class Database:
     config: Config
     logger: SuppressedLoggerAdapter
     connection: Connection
+    _readConnection: Connection
+    _bannedGifs: set[str] | None
+    _whitelistedGifs: set[str] | None
+    _filteredUsers: set[int] | None
+    _reactions: set[str] | None
+    _bannedGifPattern: Pattern[str] | None
+    _bannedGifPatternStale: bool
+    _userExists: TTLCache[int, bool]
+    _userReactions: TTLCache[int, tuple[str, ...]]
+    _pendingMessagesSent: Counter[int]
+    _pendingMessagesSentLock: Lock
+    _flushThreshold: int = 500
+    _executor: ThreadPoolExecutor
+    _writeLock: RLock
 
     def __init__(self, config, databaseLocation: Path = Path("BotData/database.db")):
         self.config = config
         self.logger = createLogger("Database", config.loggingLevel)
         self.logger.info("Initializing database")
 
-        self.connection = connect(databaseLocation, check_same_thread=False)
+        # sqlite3 keeps compiled statements in a per-connection cache keyed by the SQL text, so every query below is
+        # only prepared once. The cache is sized well above the number of distinct statements so none are ever evicted
+        self.connection = connect(
+            databaseLocation, check_same_thread=False, cached_statements=256, isolation_level=None
+        )
+
+        # WAL lets reads run alongside writes and, with synchronous=NORMAL, only syncs on checkpoints instead of on
+        # every commit
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("PRAGMA temp_store=MEMORY")
+        self.connection.execute("PRAGMA mmap_size=268435456")
+        self.connection.execute("PRAGMA cache_size=-20000")
+        self.connection.execute("PRAGMA busy_timeout=5000")
+
+        # Databases created before messages_deleted was added to setup.py do not have the column yet
+        if "messages_deleted" not in {column[1] for column in self.connection.execute("PRAGMA table_info(users)")}:
+            self.logger.info("Adding messages_deleted column to users table")
+            self.connection.execute("ALTER TABLE users ADD COLUMN messages_deleted INTEGER DEFAULT 0 NOT NULL")
+
+        # Covering indexes for the leaderboards and rank lookups, which would otherwise scan and sort the whole users
+        # table. They include every column the leaderboards select so the table itself is never read
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_users_messages_sent_cover ON users (messages_sent DESC, id, username)"
+        )
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_users_messages_deleted_cover ON users (messages_deleted DESC, id, username)"
+        )
+
+        # Refresh the query planner's statistics if they are missing or out of date, so the indexes above get used
+        self.connection.execute("PRAGMA optimize")
+
+        # Reads go through a separate read only connection. In WAL mode it reads the last committed state, so reads
+        # made from the event loop never wait behind a write transaction running on the database thread
+        self._readConnection = connect(
+            f"{databaseLocation.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False, cached_statements=256,
+            isolation_level=None
+        )
+        self._readConnection.execute("PRAGMA temp_store=MEMORY")
+        self._readConnection.execute("PRAGMA mmap_size=268435456")
+        self._readConnection.execute("PRAGMA cache_size=-20000")
+        self._readConnection.execute("PRAGMA busy_timeout=5000")
+
+        # A single worker thread keeps queries off the event loop while still running them one at a time
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="Database")
+
+        # Every write goes through _transaction, which holds this lock for the whole transaction. Writes share one
+        # connection, so without it a write made from another thread would land inside (or fail to start alongside) a
+        # transaction that is already open
+        self._writeLock = RLock()
+
+        # Cached table contents, loaded on first access and kept in sync by the methods that modify them
+        self._bannedGifs = None
+        self._whitelistedGifs = None
+        self._filteredUsers = None
+        self._reactions = None
+        self._bannedGifPattern = None
+        self._bannedGifPatternStale = True
+
+        # Per-user lookups made on every message, expired after a while or invalidated by the methods that modify them
+        self._userExists = TTLCache(maxsize=50_000, ttl=3600)
+        self._userReactions = TTLCache(maxsize=10_000, ttl=300)
+
+        # Message counts waiting to be written to the database by flushMessagesSent
+        self._pendingMessagesSent = Counter()
+        # Increments are made on the event loop thread while flushes run on the database thread, so both hold this
+        self._pendingMessagesSentLock = Lock()
+        registerExitHandler(self.close)
 
         self.logger.info("Main database initialized")
 
+    async def run(self, function: Callable, *args) -> Any:
+        """
+        Runs a blocking database method on the database thread so it does not block the event loop.
+
+        Args:
+            function (Callable): The method to run.
+            *args: The arguments to pass to the method.
+
+        Returns:
+            The return value of the method.
+        """
+        return await get_running_loop().run_in_executor(self._executor, partial(function, *args))
+
+    def close(self) -> None:
+        """
+        Writes any pending message counts, updates the query planner's statistics, and closes the database connections.
+        Runs automatically when the process exits.
+        """
+        self._executor.shutdown(wait=True)
+        self.flushMessagesSent()
+        self.connection.execute("PRAGMA optimize")
+
+        self._readConnection.close()
+        self.connection.close()
+
+    @contextmanager
+    def _transaction(self) -> Generator[None, None, None]:
+        """
+        Runs the statements in the with block in a single transaction, rolling back if any of them fail. Only one
+        transaction runs at a time, other threads wait for the current one to finish before starting theirs. Nested uses
+        on the same thread become part of the outer transaction.
+        """
+        with self._writeLock:
+            if self.connection.in_transaction:
+                yield
+                return
+
+            self.connection.execute("BEGIN")
+            try:
+                yield
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+            self.connection.execute("COMMIT")
+
     """
     # Properties
 ************************************************************************************************************************
@@ -131,57 +289,57 @@ class Database:
         Returns:
             list: The users.
         """
-        cursor: Cursor = self.connection.cursor()
-        cursor.execute("SELECT * FROM users")
-        return cursor.fetchall()
+        return self._readConnection.execute("SELECT * FROM users").fetchall()
 
     @property
-    def bannedGifs(self) -> list[str]:
+    def bannedGifs(self) -> set[str]:
         """
         Gets the banned gifs from the database.
 
         Returns:
-            list: The banned gifs.
+            set: The banned gifs.
         """
-        cursor: Cursor = self.connection.cursor()
-        cursor.execute("SELECT url FROM banned_gifs")
-        return [x[0] for x in cursor.fetchall()]
+        if self._bannedGifs is None:
+            self._bannedGifs = {x[0] for x in self._readConnection.execute("SELECT url FROM banned_gifs")}
+        return self._bannedGifs
 
     @property
-    def whitelistedGifs(self):
+    def whitelistedGifs(self) -> set[str]:
         """
         Gets the whitelisted gifs from the database.
 
         Returns:
-            list: The whitelisted gifs.
+            set: The whitelisted gifs.
         """
-        cursor: Cursor = self.connection.cursor()
-        cursor.execute("SELECT url FROM whitelist")
-        return [x[0] for x in cursor.fetchall()]
+        if self._whitelistedGifs is None:
+            self._whitelistedGifs = {x[0] for x in self._readConnection.execute("SELECT url FROM whitelist")}
+        return self._whitelistedGifs
 
     @property
-    def filteredUsers(self):
+    def filteredUsers(self) -> set[int]:
         """
         Gets the users from the database that have opted in to filtering.
 
         Returns:
-            list: The filtered users.
+            set: The filtered users.
         """
-        cursor: Cursor = self.connection.cursor()
-        cursor.execute("SELECT id FROM users where apply_filter=1")
-        return [x[0] for x in cursor.fetchall()]
+        if self._filteredUsers is None:
+            self._filteredUsers = {
+                x[0] for x in self._readConnection.execute("SELECT id FROM users where apply_filter=1")
+            }
+        return self._filteredUsers
 
     @property
-    def reactions(self):
+    def reactions(self) -> set[str]:
         """
         Gets the reactions from the database.
 
         Returns:
-            list: The reactions.
+            set: The reactions.
         """
-        cursor: Cursor = self.connection.cursor()
-        cursor.execute("SELECT reaction FROM reactions")
-        return [x[0] for x in cursor.fetchall()]
+        if self._reactions is None:
+            self._reactions = {x[0] for x in self._readConnection.execute("SELECT reaction FROM reactions")}
+        return self._reactions
 
     """
     # Database Checks
@@ -195,9 +353,11 @@ class Database:
         Args:
             uid (int): The user id.
         """
-        cursor: Cursor = self.connection.cursor()
-        cursor.execute("SELECT id FROM users WHERE id=?", (uid,))
-        return cursor.fetchone() is not None
+        exists: bool | None = self._userExists.get(uid)
+        if exists is None:
+            exists = self._userExists[uid] = \
+                self._readConnection.execute("SELECT id FROM users WHERE id=?", (uid,)).fetchone() is not None
+        return exists
 
     def checkGifBanned(self, gifUrl):
         """
@@ -209,9 +369,7 @@ class Database:
         Returns:
             bool: Whether the gif is banned.
         """
-        cursor: Cursor = self.connection.cursor()
-        cursor.execute("SELECT id FROM banned_gifs WHERE url=?", (gifUrl,))
-        return cursor.fetchone() is not None
+        return gifUrl in self.bannedGifs
 
     def checkMessageBannedGifs(self, message: str) -> bool:
         """
@@ -223,14 +381,17 @@ class Database:
         Returns:
             bool: Whether the message contains a banned gif.
         """
-        cursor: Cursor = self.connection.cursor()
-        bannedGifs = cursor.execute("SELECT url FROM banned_gifs").fetchall()
         self.logger.info("Checking message for banned gifs.")
 
-        for gif in bannedGifs:
-            if gif[0] in message:
-                self.logger.info("Message contains banned gif.")
-                return True
+        # All banned gifs are matched in a single scan of the message, the pattern is only rebuilt when they change
+        if self._bannedGifPatternStale:
+            bannedGifs: set[str] = self.bannedGifs
+            self._bannedGifPattern = compileRegex("|".join(map(escape, bannedGifs))) if bannedGifs else None
+            self._bannedGifPatternStale = False
+
+        if self._bannedGifPattern is not None and self._bannedGifPattern.search(message):
+            self.logger.info("Message contains banned gif.")
+            return True
 
         self.logger.info("Message does not contain banned gif.")
         return False
@@ -246,24 +407,50 @@ class Database:
             bool: Whether the user is an admin.
         """
         # Check if the user is an administrator in the server TODO: Test this and move it out of database.py
-        if user.top_role.permissions.administrator or user.id in self.config.owonerId:
-            return True
+        # Not cached, admin status differs between servers and can be revoked at any time
+        return bool(user.id in self.config.owonerId or user.top_role.permissions.administrator)
 
     """
     # Database Modification
 ************************************************************************************************************************
     """
 
-    def incrementMessagesSent(self, uid: int):
+    def incrementMessagesSent(self, uid: int) -> bool:
         """
-        Increments the number of messages sent by a user.
+        Increments the number of messages sent by a user. The increment is held in memory until flushMessagesSent is
+        called.
 
         Args:
             uid (int): The user id.
+
+        Returns:
+            bool: Whether enough users have pending increments that flushMessagesSent should be called now.
+        """
+        with self._pendingMessagesSentLock:
+            self._pendingMessagesSent[uid] += 1
+            return len(self._pendingMessagesSent) >= self._flushThreshold
+
+    def flushMessagesSent(self):
         """
-        cursor: Cursor = self.connection.cursor()
-        cursor.execute("UPDATE users SET messages_sent=messages_sent+1 WHERE id=?", (uid,))
-        self.connection.commit()
+        Writes all pending message count increments to the database in a single transaction.
+        """
+        # Swap the counter out first so increments made while this runs on another thread go into the next flush
+        with self._pendingMessagesSentLock:
+            if not self._pendingMessagesSent:
+                return
+            pendingMessagesSent: Counter[int] = self._pendingMessagesSent
+            self._pendingMessagesSent = Counter()
+
+        pending: list[tuple[int, int]] = [(count, uid) for uid, count in pendingMessagesSent.items()]
+
+        try:
+            with self._transaction():
+                self.connection.executemany("UPDATE users SET messages_sent=messages_sent+? WHERE id=?", pending)
+        except BaseException:
+            # Put the counts back so they are written by the next flush instead of being lost
+            with self._pendingMessagesSentLock:
+                self._pendingMessagesSent.update(pendingMessagesSent)
+            raise
 
     """
     # Set Methods
@@ -278,10 +465,27 @@ class Database:
             uid (int): The user id.
             value (int): The value to set messages_sent to.
         """
-        self.logger.debug(f"Setting messages sent for user {uid}({self.getUserName(uid)}) to {value}")
-        cursor: Cursor = self.connection.cursor()
-        cursor.execute("UPDATE users SET messages_sent=? WHERE id=?", (value, uid))
-        self.connection.commit()
+        self.logger.debug("Setting messages sent for user %s to %s", uid, value)
+        with self._transaction():
+            self.connection.execute("UPDATE users SET messages_sent=? WHERE id=?", (value, uid))
+
+    def setMessagesSentBulk(self, users: list[tuple[int, str, int]]):
+        """
+        Sets the number of messages sent by many users in a single transaction, adding any users that do not exist yet.
+
+        Args:
+            users (list[tuple[int, str, int]]): The user id, username, and value to set messages_sent to for each user.
+                The username is only used when the user is added.
+        """
+        with self._transaction():
+            self.connection.executemany(
+                "INSERT INTO users (id, username, messages_sent) VALUES (?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET messages_sent=excluded.messages_sent",
+                users
+            )
+
+        for uid, _, _ in users:
+            self._userExists[uid] = True
 
     def setUsername(self, uid: int, username: str):
         """
@@ -291,9 +495,18 @@ class Database:
             uid (int): The user id.
             username (str): The username.
         """
-        cursor: Cursor = self.connection.cursor()
-        cursor.execute("UPDATE users SET username=? WHERE id=?", (username, uid))
-        self.connection.commit()
+        with self._transaction():
+            self.connection.execute("UPDATE users SET username=? WHERE id=?", (username, uid))
+
+    def setUsernameBulk(self, users: list[tuple[str, int]]):
+        """
+        Sets the usernames of many users in a single transaction.
+
+        Args:
+            users (list[tuple[str, int]]): The username and user id of each user.
+        """
+        with self._transaction():
+            self.connection.executemany("UPDATE users SET username=? WHERE id=?", users)
 
     """
     ## Adding
@@ -310,23 +523,47 @@ class Database:
             reason (str): The reason for the ban.
 
         """
-        cursor: Cursor = self.connection.cursor()
-        cursor.execute("INSERT INTO banned_gifs (banned_by, url, reason) VALUES (?, ?, ?)",
-                       (bannedBy, gifUrl, reason))
-        self.connection.commit()
+        self.addBannedGifs([(bannedBy, gifUrl, reason)])
+
+    def addBannedGifs(self, gifs: list[tuple[int, str, str | None]]):
+        """
+        Adds many banned gifs to the database in a single transaction.
+
+        Args:
+            gifs (list[tuple[int, str, str | None]]): The user who banned the gif, the gif url, and the reason for the
+                ban of each gif.
+        """
+        with self._transaction():
+            self.connection.executemany("INSERT INTO banned_gifs (banned_by, url, reason) VALUES (?, ?, ?)", gifs)
+
+        self.bannedGifs.update(gifUrl for _, gifUrl, _ in gifs)
+        self._bannedGifPatternStale = True
 
     def addUser(self, userId: int, username: str):
         """
-        Adds a user to the database.
+        Adds a user to the database. Nothing happens if the user already exists, so callers racing to add the same
+        new user do not fail.
 
         Args:
             userId (int): The user id.
             username (str): The username.
         """
-        cursor: Cursor = self.connection.cursor()
-        cursor.execute("INSERT INTO users (id, username) VALUES (?, ?)",
-                       (userId, username))
-        self.connection.commit()
+        with self._transaction():
+            self.connection.execute("INSERT OR IGNORE INTO users (id, username) VALUES (?, ?)", (userId, username))
+        self._userExists[userId] = True
+
+    def addUsers(self, users: list[tuple[int, str]]):
+        """
+        Adds many users to the database in a single transaction. Users that already exist are skipped.
+
+        Args:
+            users (list[tuple[int, str]]): The user id and username of each user.
+        """
+        with self._transaction():
+            self.connection.executemany("INSERT OR IGNORE INTO users (id, username) VALUES (?, ?)", users)
+
+        for userId, _ in users:
+            self._userExists[userId] = True
 
     def addWhitelistedGif(self, addedBy: int, gifUrl: str):
         """
@@ -336,9 +573,19 @@ class Database:
             addedBy (int): The ID of the user who added the gif to the whitelist.
             gifUrl (str): The gif url.
         """
-        cursor: Cursor = self.connection.cursor()
-        cursor.execute("INSERT INTO whitelist (url, added_by) VALUES (?, ?)", (gifUrl, addedBy))
-        self.connection.commit()
+        self.addWhitelistedGifs([(gifUrl, addedBy)])
+
+    def addWhitelistedGifs(self, gifs: list[tuple[str, int]]):
+        """
+        Adds many whitelisted gifs to the database in a single transaction.
+
+        Args:
+            gifs (list[tuple[str, int]]): The gif url and the ID of the user who added it of each gif.
+        """
+        with self._transaction():
+            self.connection.executemany("INSERT INTO whitelist (url, added_by) VALUES (?, ?)", gifs)
+
+        self.whitelistedGifs.update(gifUrl for gifUrl, _ in gifs)
 
     def addReaction(self, reaction: str, addedBy: int, appliesTo: int):
         """
@@ -349,10 +596,24 @@ class Database:
             addedBy (int): The user who added the reaction.
             appliesTo (int): The user for the reaction to apply to
         """
-        cursor: Cursor = self.connection.cursor()
-        cursor.execute("INSERT INTO reactions (reaction, added_by, applies_to) VALUES (?, ?, ?)",
-                       (reaction, addedBy, appliesTo))
-        self.connection.commit()
+        self.addReactions([(reaction, addedBy, appliesTo)])
+
+    def addReactions(self, reactions: list[tuple[str, int, int]]):
+        """
+        Adds many reactions to the database in a single transaction.
+
+        Args:
+            reactions (list[tuple[str, int, int]]): The reaction, the user who added it, and the user it applies to of
+                each reaction.
+        """
+        with self._transaction():
+            self.connection.executemany(
+                "INSERT INTO reactions (reaction, added_by, applies_to) VALUES (?, ?, ?)", reactions
+            )
+
+        for reaction, _, appliesTo in reactions:
+            self._userReactions.pop(appliesTo, None)
+            self.reactions.add(reaction)
 
     """
     ## Removing
@@ -366,9 +627,20 @@ class Database:
         Args:
             gifUrl (str): The gif url.
         """
-        cursor: Cursor = self.connection.cursor()
-        cursor.execute("DELETE FROM banned_gifs WHERE url=?", (gifUrl,))
-        self.connection.commit()
+        self.removeBannedGifs([gifUrl])
+
+    def removeBannedGifs(self, gifUrls: list[str]) -> None:
+        """
+        Removes many banned gifs from the database in a single transaction.
+
+        Args:
+            gifUrls (list[str]): The gif urls.
+        """
+        with self._transaction():
+            self.connection.executemany("DELETE FROM banned_gifs WHERE url=?", ((gifUrl,) for gifUrl in gifUrls))
+
+        self.bannedGifs.difference_update(gifUrls)
+        self._bannedGifPatternStale = True
 
     def removeWhitelistedGif(self, gifUrl: str):
         """
@@ -377,9 +649,19 @@ class Database:
         Args:
             gifUrl (str): The gif url.
         """
-        cursor: Cursor = self.connection.cursor()
-        cursor.execute("DELETE FROM whitelist WHERE url=?", (gifUrl,))
-        self.connection.commit()
+        self.removeWhitelistedGifs([gifUrl])
+
+    def removeWhitelistedGifs(self, gifUrls: list[str]):
+        """
+        Removes many whitelisted gifs from the database in a single transaction.
+
+        Args:
+            gifUrls (list[str]): The gif urls.
+        """
+        with self._transaction():
+            self.connection.executemany("DELETE FROM whitelist WHERE url=?", ((gifUrl,) for gifUrl in gifUrls))
+
+        self.whitelistedGifs.difference_update(gifUrls)
 
     def removeReaction(self, reaction: str, appliesTo: int):
         """
@@ -389,16 +671,28 @@ class Database:
             reaction (str): The reaction escape code
             appliesTo (int): The user id.
         """
-        cursor: Cursor = self.connection.cursor()
-        cursor.execute("DELETE FROM reactions WHERE reaction=? AND applies_to=?", (reaction, appliesTo))
-        self.connection.commit()
+        self.removeReactions([(reaction, appliesTo)])
+
+    def removeReactions(self, reactions: list[tuple[str, int]]):
+        """
+        Removes many reactions from the database in a single transaction.
+
+        Args:
+            reactions (list[tuple[str, int]]): The reaction escape code and the user id of each reaction.
+        """
+        with self._transaction():
+            self.connection.executemany("DELETE FROM reactions WHERE reaction=? AND applies_to=?", reactions)
+
+        for _, appliesTo in reactions:
+            self._userReactions.pop(appliesTo, None)
+        self._reactions = None  # The reactions may still apply to other users, so reload them on next access
 
     """
     # Get Methods
 ************************************************************************************************************************
     """
 
-    def getUserReactions(self, user: int) -> list:
+    def getUserReactions(self, user: int) -> tuple[str, ...]:
         """
         Gets the reactions for a user.
 
@@ -406,16 +700,43 @@ class Database:
             user: The ID of the user.
 
         Returns:
-            list: The reaction escape codes
+            tuple: The reaction escape codes
         """
 
-        self.logger.info(f"Getting reactions for user {user}")
-        cursor: Cursor = self.connection.cursor()
-        cursor.execute("SELECT reaction FROM reactions WHERE applies_to=?", (user,))
-        reactions = cursor.fetchall()
-        self.logger.debug(f"Reactions for user {user}: {reactions}")
+        self.logger.info("Getting reactions for user %s", user)
+        reactions: tuple[str, ...] | None = self._userReactions.get(user)
+        if reactions is None:
+            # Stored as a tuple so the cached value can be handed out without copying
+            reactions = self._userReactions[user] = tuple(
+                x[0] for x in self._readConnection.execute("SELECT reaction FROM reactions WHERE applies_to=?", (user,))
+            )
+        self.logger.debug("Reactions for user %s: %s", user, reactions)
         return reactions
 
+    def getUserIds(self) -> set[int]:
+        """
+        Gets the ids of all users in the database.
+
+        Returns:
+            set: The user ids.
+        """
+        return {x[0] for x in self._readConnection.execute("SELECT id FROM users")}
+
+    def getUserStats(self, uid: int) -> UserStats | None:
+        """
+        Gets the username and message counts of a user in a single query.
+
+        Args:
+            uid (int): The user id.
+
+        Returns:
+            UserStats | None: The user's stats, or None if the user does not exist.
+        """
+        row: tuple[str, int, int] | None = self._readConnection.execute(
+            "SELECT username, messages_sent, messages_deleted FROM users WHERE id=?", (uid,)
+        ).fetchone()
+        return UserStats(*row) if row is not None else None
+
     def getUserName(self, uid: int) -> str:
         """
         Gets the username of a user.
@@ -426,9 +747,7 @@ class Database:
         Returns:
             str: The username.
         """
-        cursor: Cursor = self.connection.cursor()
-        cursor.execute("SELECT username FROM users WHERE id=?", (uid,))
-        return cursor.fetchone()[0]
+        return self._readConnection.execute("SELECT username FROM users WHERE id=?", (uid,)).fetchone()[0]
 
     def getMessagesSent(self, uid: int) -> int:
         """
@@ -440,9 +759,7 @@ class Database:
         Returns:
             int: The number of messages sent.
         """
-        cursor: Cursor = self.connection.cursor()
-        cursor.execute("SELECT messages_sent FROM users WHERE id=?", (uid,))
-        return cursor.fetchone()[0]
+        return self._readConnection.execute("SELECT messages_sent FROM users WHERE id=?", (uid,)).fetchone()[0]
 
     def getMessagesSentRank(self, uid: int) -> int:
         """
@@ -454,10 +771,9 @@ class Database:
         Returns:
             int: The number of messages sent.
         """
-        cursor: Cursor = self.connection.cursor()
-        cursor.execute("SELECT COUNT(*) FROM users WHERE messages_sent > "
-                       "(SELECT messages_sent FROM users WHERE id=?)", (uid,))
-        return cursor.fetchone()[0] + 1
+        return self._readConnection.execute(
+            "SELECT COUNT(*) FROM users WHERE messages_sent > (SELECT messages_sent FROM users WHERE id=?)", (uid,)
+        ).fetchone()[0] + 1
 
     def getMessagesDeleted(self, uid: int) -> int:
         """  # TODO: Make all of these server specific (so that it only counts for users that are in the current server)
@@ -469,9 +785,7 @@ class Database:
         Returns:
             int: The number of messages deleted.
         """
-        cursor: Cursor = self.connection.cursor()
-        cursor.execute("SELECT messages_deleted FROM users WHERE id=?", (uid,))
-        return cursor.fetchone()[0]
+        return self._readConnection.execute("SELECT messages_deleted FROM users WHERE id=?", (uid,)).fetchone()[0]
 
     def getTopMessagesSent(self, limit: int) -> list:
         """
@@ -483,10 +797,9 @@ class Database:
         Returns:
             list: The top users.
         """
-        cursor: Cursor = self.connection.cursor()
-        cursor.execute("SELECT id, username, messages_sent FROM users ORDER BY messages_sent DESC LIMIT ?",
-                       (limit,))
-        return cursor.fetchall()
+        return self._readConnection.execute(
+            "SELECT id, username, messages_sent FROM users ORDER BY messages_sent DESC LIMIT ?", (limit,)
+        ).fetchall()
 
     def getTopMessagesDeleted(self, limit: int) -> list:
         """
@@ -498,11 +811,9 @@ class Database:
         Returns:
             list: The top users.
         """
-        cursor: Cursor = self.connection.cursor()
-        cursor.execute("SELECT id, username, messages_deleted FROM users ORDER BY messages_deleted DESC LIMIT ?",
-                       (limit,))
-
-        return cursor.fetchall()
+        return self._readConnection.execute(
+            "SELECT id, username, messages_deleted FROM users ORDER BY messages_deleted DESC LIMIT ?", (limit,)
+        ).fetchall()
 
     def getMessagesDeletedRank(self, uid: int) -> int:
         """
@@ -514,7 +825,7 @@ class Database:
         Returns:
             int: The number of messages deleted.
         """
-        cursor: Cursor = self.connection.cursor()
-        cursor.execute("SELECT COUNT(*) FROM users WHERE messages_deleted > "
-                       "(SELECT messages_deleted FROM users WHERE id=?)", (uid,))
-        return cursor.fetchone()[0] + 1
+        return self._readConnection.execute(
+            "SELECT COUNT(*) FROM users WHERE messages_deleted > (SELECT messages_deleted FROM users WHERE id=?)",
+            (uid,)
+        ).fetchone()[0] + 1
@@ -3,19 +3,165 @@ Base class for all data types.
 """
 
 # Standard Library Imports
-from typing import Any
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Dict, Iterable
 from datetime import datetime
 
 # Third Party Imports
 from psycopg2.extensions import connection as Connection
-from psycopg2.extras import RealDictRow, RealDictCursor
-from psycopg2.sql import SQL, Identifier
+from psycopg2.extras import RealDictRow, RealDictCursor, execute_values
+from psycopg2.sql import SQL, Composed, Identifier
+
+
+"""
+========================================================================================================================
+    Statement Builders
+========================================================================================================================
+"""
+# The identifiers in these statements only depend on the table names involved, so each distinct statement is composed
+# once and reused for every subsequent call.
+
+
+@lru_cache(maxsize=512)
+def _setSql(
+        tableName: str,
+        column: str
+) -> Composed:
+    """
+    Builds the statement used to set a column of a row.
+
+    Args:
+        tableName (str): The _name of the table.
+        column (str): The column to set.
+
+    Returns:
+        Composed: The composed statement.
+    """
+    return SQL("UPDATE {tableName} SET {column} = %s WHERE id = %s").format(
+        tableName=Identifier(tableName),
+        column=Identifier(column),
+    )
+
+
+@lru_cache(maxsize=512)
+def _getAssocSql(
+        tableName: str,
+        target: str,
+        columns: tuple[str, ...]
+) -> Composed:
+    """
+    Builds the statement used to get related data through a relation table.
+
+    Args:
+        tableName (str): The _name of the table.
+        target (str): The _name of the target table.
+        columns (tuple[str, ...]): The columns to get.
+
+    Returns:
+        Composed: The composed statement.
+    """
+    return SQL("""
+    SELECT {columns}
+    FROM {target} 
+    JOIN {relationTable} 
+    ON {target}.id = {relationTable}.{target}_id 
+    WHERE {relationTable}.{_tableName}_id = %s
+    """).format(
+        columns=SQL(", ").join(map(Identifier, columns)),
+        target=Identifier(target),
+        relationTable=Identifier(f"{tableName}_{target}"),
+        _tableName=Identifier(tableName)
+    )
+
+
+@lru_cache(maxsize=512)
+def _getAssocManySql(
+        tableName: str,
+        target: str,
+        columns: tuple[str, ...]
+) -> Composed:
+    """
+    Builds the statement used to get related data for many rows at once through a relation table. The ID of the row
+    each result belongs to is returned in the _owner_id column.
+
+    Args:
+        tableName (str): The _name of the table.
+        target (str): The _name of the target table.
+        columns (tuple[str, ...]): The columns to get.
+
+    Returns:
+        Composed: The composed statement.
+    """
+    return SQL("""
+    SELECT {relationTable}.{_tableName}_id AS _owner_id, {columns}
+    FROM {target} 
+    JOIN {relationTable} 
+    ON {target}.id = {relationTable}.{target}_id 
+    WHERE {relationTable}.{_tableName}_id = ANY(%s)
+    """).format(
+        columns=SQL(", ").join(map(Identifier, columns)),
+        target=Identifier(target),
+        relationTable=Identifier(f"{tableName}_{target}"),
+        _tableName=Identifier(tableName)
+    )
+
+
+@lru_cache(maxsize=512)
+def _deleteAssocSql(
+        tableName: str,
+        target: str
+) -> Composed:
+    """
+    Builds the statement used to delete related data from a relation table.
+
+    Args:
+        tableName (str): The _name of the table.
+        target (str): The _name of the target table.
+
+    Returns:
+        Composed: The composed statement.
+    """
+    return SQL("DELETE FROM {relationTable} WHERE {_tableName}_id = %s").format(
+        relationTable=Identifier(f"{tableName}_{target}"),
+        _tableName=Identifier(tableName)
+    )
+
+
+@lru_cache(maxsize=512)
+def _addAssocSql(
+        tableName: str,
+        target: str
+) -> Composed:
+    """
+    Builds the statement used to add related data to a relation table. The statement is a template for
+    execute_values, so a single statement can insert any number of rows.
+
+    Args:
+        tableName (str): The _name of the table.
+        target (str): The _name of the target table.
+
+    Returns:
+        Composed: The composed statement.
+    """
+    return SQL("INSERT INTO {relationTable} ({_tableName}_id, {target}_id) VALUES %s").format(
+        relationTable=Identifier(f"{tableName}_{target}"),
+        _tableName=Identifier(tableName),
+        target=Identifier(target)
+    )
 
 
 class Base:
     """
     Base class for all data types.
     """
+    __slots__ = ("id", "createdAt", "_connection")
+
+    # The fields included when the data type is converted to a dictionary
+    _publicFields: tuple[str, ...] = ("id", "createdAt")
+    # Maps the columns of the table to the attributes they are stored in
+    _columns: dict[str, str] = {"id": "id", "created_at": "createdAt"}
+
     # Type hints
     id: int
     createdAt: datetime
@@ -25,7 +171,6 @@ class Base:
 
     def __init__(
             self,
-            tableName: str,
             connection: Connection,
             id: int,
             createdAt: datetime
@@ -34,7 +179,6 @@ class Base:
         Initializes the Base object.
 
         Args:
-            tableName (str): The _name of the table in the database.
             connection (Connection): The connection to use for database operations.
             id (int): The ID of the data type.
             createdAt (datetime): The time the data type was created.
@@ -42,11 +186,32 @@ class Base:
         Returns:
             None
         """
-        self._tableName = tableName
         self._connection = connection
         self.id = id
         self.createdAt = createdAt  # String conversion is handled by postgres
 
+    @classmethod
+    def fromRow(
+            cls,
+            connection: Connection,
+            row: RealDictRow
+    ):
+        """
+        Creates the data type directly from a row of its table, without unpacking the row into keyword arguments.
+
+        Args:
+            connection (Connection): The connection to use for database operations.
+            row (RealDictRow): The row to create the data type from.
+
+        Returns:
+            The data type.
+        """
+        self = cls.__new__(cls)
+        self._connection = connection
+        for column, value in row.items():
+            setattr(self, cls._columns[column], value)
+        return self
+
     def __int__(self) -> int:
         """
         Returns the ID of the data type.
@@ -63,7 +228,7 @@ class Base:
         Returns:
             dict: The data type as a dictionary.
         """
-        return self.__dict__
+        return {field: getattr(self, field) for field in self._publicFields}
 
     """
 ================================================================================================================================================================
@@ -88,10 +253,7 @@ class Base:
         """
         with self._connection.cursor() as cursor:
             cursor.execute(
-                SQL("UPDATE {tableName} SET {column} = %s WHERE id = %s").format(
-                    tableName=Identifier(self._tableName),
-                    column=Identifier(column),
-                ),
+                _setSql(self._tableName, column),
                 (value, self.id)
             )
 
@@ -111,22 +273,41 @@ class Base:
         """
         with self._connection.cursor(cursor_factory=RealDictCursor) as cursor:
             cursor.execute(
-                SQL("""
-                SELECT {columns}
-                FROM {target} 
-                JOIN {relationTable} 
-                ON {target}.id = {relationTable}.{target}_id 
-                WHERE {relationTable}.{_tableName}_id = %s
-                """).format(
-                    columns=SQL(", ").join(map(Identifier, columns)),
-                    target=Identifier(target),
-                    relationTable=Identifier(f"{self._tableName}_{target}"),
-                    _tableName=Identifier(self._tableName)
-                ),
+                _getAssocSql(self._tableName, target, tuple(columns)),
                 (self.id,)
             )
             return cursor.fetchall()
 
+    @classmethod
+    def _getAssocMany(
+            cls,
+            connection: Connection,
+            ids: Iterable[int],
+            target: str,
+            columns: tuple[str] = ("*",)
+    ) -> Dict[int, list[RealDictRow]]:
+        """
+        Gets related data for many data types from the database in a single query.
+
+        Args:
+            connection (Connection): The connection to use for database operations.
+            ids (Iterable[int]): The IDs of the data types to get related data for.
+            target (str): The _name of the target table.
+            columns (list[str]): The columns to get.
+
+        Returns:
+            dict[int, list[RealDictRow]]: The related data, keyed by the ID of the data type it belongs to.
+        """
+        related: defaultdict[int, list[RealDictRow]] = defaultdict(list)
+        with connection.cursor(cursor_factory=RealDictCursor) as cursor:
+            cursor.execute(
+                _getAssocManySql(cls._tableName, target, tuple(columns)),
+                (list(ids),)
+            )
+            for row in cursor:
+                related[row.pop("_owner_id")].append(row)
+        return related
+
     def _deleteAssoc(
             self,
             target: str
@@ -142,10 +323,7 @@ class Base:
         """
         with self._connection.cursor() as cursor:
             cursor.execute(
-                SQL("DELETE FROM {relationTable} WHERE {_tableName}_id = %s").format(
-                    relationTable=Identifier(f"{self._tableName}_{target}"),
-                    _tableName=Identifier(self._tableName)
-                ),
+                _deleteAssocSql(self._tableName, target),
                 (self.id,)
             )
 
@@ -161,16 +339,30 @@ class Base:
             target (str): The _name of the target table.
             targetId (int): The ID of the target data type.
 
+        Returns:
+            None
+        """
+        self._addAssocMany(target, (targetId,))
+
+    def _addAssocMany(
+            self,
+            target: str,
+            targetIds: Iterable[int]
+    ) -> None:
+        """
+        Adds multiple rows of related data to the database in a single statement.
+
+        Args:
+            target (str): The _name of the target table.
+            targetIds (Iterable[int]): The IDs of the target data types.
+
         Returns:
             None
         """
         with self._connection.cursor() as cursor:
-            cursor.execute(
-                SQL("INSERT INTO {relationTable} ({_tableName}_id, {target}_id) VALUES (%s, %s)").format(
-                    relationTable=Identifier(f"{self._tableName}_{target}"),
-                    _tableName=Identifier(self._tableName),
-                    target=Identifier(target)
-                ),
-                (self.id, targetId)
+            execute_values(
+                cursor,
+                _addAssocSql(self._tableName, target),
+                [(self.id, targetId) for targetId in targetIds],
+                page_size=1000
             )
-
@@ -15,6 +15,12 @@ class Guild(Base):
     """
     Guild datatype.
     """
+    __slots__ = ("_name",)
+
+    _tableName = "guilds"
+    _publicFields = Base._publicFields + ("name",)
+    _columns = Base._columns | {"name": "_name"}
+
     # Type hints
     _name: str
 
@@ -37,7 +43,7 @@ class Guild(Base):
         Returns:
             None
         """
-        super().__init__("guilds", connection, id, createdAt)
+        super().__init__(connection, id, createdAt)
         self._name = name
 
     """
@@ -67,3 +73,4 @@ class Guild(Base):
             None
         """
         self._set("name", value)
+        self._name = value
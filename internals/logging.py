@@ -2,19 +2,48 @@
 Contains custom logging configuration systems
 """
 # Standard Library Imports
+from atexit import register as registerExitHandler
 from datetime import datetime
-from logging import (CRITICAL, DEBUG, ERROR, FileHandler, Formatter, Handler, INFO, Logger, LoggerAdapter,
+from functools import lru_cache
+from logging import (CRITICAL, DEBUG, ERROR, FileHandler, Formatter, Handler, INFO, Logger, LoggerAdapter, NOTSET,
                      StreamHandler, WARNING, getLogger)
 from logging import LogRecord
-from os import getcwd, mkdir, path
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from queue import Empty, Queue
 from sys import stdout
+from threading import Lock
+from time import monotonic, sleep, strftime
 from typing import Literal
 
 # Third Party Imports
+from psycopg2 import OperationalError
 from psycopg2.extensions import connection as Connection, cursor as Cursor
-
-
+from psycopg2.extras import execute_values
+
+# The logging levels that can be given to createLogger by name
+_levels: dict[str, int] = {
+    "debug": DEBUG,
+    "info": INFO,
+    "warning": WARNING,
+    "error": ERROR,
+    "critical": CRITICAL,
+}
+
+# The ANSI colour codes for each base colour, the high intensity variants are these plus 60
+_colourCodes: dict[str, int] = {
+    "BLACK": 30,
+    "RED": 31,
+    "GREEN": 32,
+    "YELLOW": 33,
+    "BLUE": 34,
+    "PURPLE": 35,
+    "CYAN": 36,
+    "WHITE": 37,
+}
+
+
+@lru_cache(maxsize=64)
 def getEscapeCode(
         baseColour: str,
         bold: bool = False,
@@ -43,47 +72,99 @@ def getEscapeCode(
     else:
         highIntensity = False
 
-    match baseColour.upper():
-        case "BLACK":
-            colourCode = 30
-        case "RED":
-            colourCode = 31
-        case "GREEN":
-            colourCode = 32
-        case "YELLOW":
-            colourCode = 33
-        case "BLUE":
-            colourCode = 34
-        case "PURPLE":
-            colourCode = 35
-        case "CYAN":
-            colourCode = 36
-        case "WHITE":
-            colourCode = 37
-        case _:
-            raise ValueError(f"{baseColour} is not a valid colour.")
+    try:
+        colourCode: int = _colourCodes[baseColour.upper()]
+    except KeyError:
+        raise ValueError(f"{baseColour} is not a valid colour.") from None
 
     if highIntensity:
         colourCode += 60
 
-    if bold:
-        formatter: str = "1;"
+    if bold and underline:
+        formatter: str = "1;4;"
+    elif bold:
+        formatter = "1;"
     elif underline:
         formatter = "4;"
-    elif bold and underline:
-        formatter = "1;4;"
     else:
         formatter = ""
     # Assemble the ANSI escape code
     return f"\033[{formatter}{colourCode}m"
 
 
-class ColourCodedFormatter(Formatter):
+# The colour coding used by ColourCodedFormatter when none is given, built once when the module is loaded
+_defaultColourCoding: dict[str, str] = {
+    "DEBUG": getEscapeCode("CYAN"),
+    "INFO": getEscapeCode("GREEN"),
+    "WARNING": getEscapeCode("YELLOW"),
+    "ERROR": getEscapeCode("RED"),
+    "CRITICAL": getEscapeCode("RED_H"),
+}
+
+
+class CachedTimeFormatter(Formatter):
+    """
+    A formatter that only formats the timestamp once per second, as many records are usually logged within the same
+    second.
+    """
+    # Type hints
+    _cachedTime: tuple[int, str]
+
+    def __init__(
+            self,
+            fmt: str | None = None,
+            datefmt: str | None = None,
+            style: Literal["%", "{", "$"] = "%"
+    ) -> None:
+        """
+        Initializes the cached time formatter.
+
+        Args:
+            fmt (str): The format string for the formatter.
+            datefmt (str): The date format string for the formatter.
+            style (str): The style of the formatter.
+
+        Returns:
+            None
+        """
+        super().__init__(fmt, datefmt, style)
+        self._cachedTime = (-1, "")
+
+    def formatTime(
+            self,
+            record: LogRecord,
+            datefmt: str | None = None
+    ) -> str:
+        """
+        Formats the time of the log record, reusing the formatted time of the previous record if it was logged in the
+        same second.
+
+        Args:
+            record (LogRecord): The log record to format the time of.
+            datefmt (str): The date format string to use.
+
+        Returns:
+            str: The formatted time.
+        """
+        if datefmt:
+            return super().formatTime(record, datefmt)
+
+        second: int = int(record.created)
+        cachedSecond, cachedTime = self._cachedTime  # Read as one tuple so other threads never see a mismatched pair
+        if second != cachedSecond:
+            cachedTime = strftime(self.default_time_format, self.converter(second))
+            self._cachedTime = (second, cachedTime)
+
+        return self.default_msec_format % (cachedTime, record.msecs)
+
+
+class ColourCodedFormatter(CachedTimeFormatter):
     """
     A formatter that adds colour coding to the log messages.
     """
     # Type hints
     colourCoding: dict[str, str]
+    _colouredLevelNames: dict[str, str]
 
     def __init__(
             self,
@@ -107,15 +188,14 @@ class ColourCodedFormatter(Formatter):
         super().__init__(fmt, datefmt, style)
 
         if colourCoding is None:
-            colourCoding = {
-                "DEBUG": getEscapeCode("CYAN"),
-                "INFO": getEscapeCode("GREEN"),
-                "WARNING": getEscapeCode("YELLOW"),
-                "ERROR": getEscapeCode("RED"),
-                "CRITICAL": getEscapeCode("RED_H"),
-            }
+            colourCoding = dict(_defaultColourCoding)
         self.colourCoding = colourCoding
 
+        # There are only a handful of levels, so the coloured level names are built once rather than for every record
+        self._colouredLevelNames = {
+            levelName: f"{escapeCode}{levelName}\033[0m" for levelName, escapeCode in colourCoding.items()
+        }
+
     def format(
             self,
             record: LogRecord
@@ -129,13 +209,17 @@ class ColourCodedFormatter(Formatter):
         Returns:
             str: The formatted log message.
         """
+        levelName: str = record.levelname
+        colouredLevelName: str | None = self._colouredLevelNames.get(levelName)
+        if colouredLevelName is None:  # Level names that are not in the colour coding dictionary are left as they are
+            return super().format(record)
 
+        # The record is shared with the other handlers, so the level name is put back once this handler is done with it
+        record.levelname = colouredLevelName
         try:
-            record.levelname = f"{self.colourCoding[record.levelname]}{record.levelname}\033[0m"
-        except KeyError:  # Handles the case where the level _name is not in the colour coding dictionary
-            pass
-
-        return super().format(record)
+            return super().format(record)
+        finally:
+            record.levelname = levelName
 
 
 # TODO: Make an audit logs handler that logs all information to an sqlite database and periodically removes logs
@@ -144,35 +228,59 @@ class ColourCodedFormatter(Formatter):
 
 class DatabaseHandler(Handler):
     """
-    A handler that logs all log messages to a database.
+    A handler that logs all log messages to a database. Records are buffered and written in batches, so this handler
+    should be run behind a DatabaseQueueListener rather than attached to a logger directly, see createLogger.
+
+    The connection must be dedicated to logging. Each batch is committed on the listener's thread with synchronous
+    commit turned off, so any transaction the application had open on a shared connection would be committed (or
+    rolled back) with it.
     """
     # Type hints
     _connection: Connection
     _cursor: Cursor
+    _buffer: list[tuple[LogRecord, str]]
+
+    # The statement used to write log rows, the placeholder is expanded by execute_values into one VALUES list for the
+    # whole batch. Rows are written up to a second after they are logged, so the time the record was created is stored
+    # rather than relying on the column default
+    _insertSql: str = "INSERT INTO logs (created_at, level, module, message) VALUES %s"
+    _insertTemplate: str = "(to_timestamp(%s), %s, %s, %s)"
+
+    # Buffered records are written once there are this many, when a record of at least the flush level arrives, or when
+    # the listener flushes the handler
+    batchSize: int = 256
+    flushLevel: int = ERROR
+
+    # How many times a batch is retried when the database cannot be reached, the delay doubles after each attempt
+    retries: int = 3
+    retryDelay: float = 0.01
 
     def __init__(
             self,
-            connection: Connection
+            connection: Connection,
+            level: int = NOTSET
     ) -> None:
         """
         Initializes the database handler.
 
         Args:
             connection (Connection): The connection to the database.
+            level (int): The minimum level of the records to write to the database.
 
         Returns:
             None
         """
-        super().__init__()
+        super().__init__(level)
         self._connection = connection
         self._cursor = connection.cursor()
+        self._buffer = []
 
     def emit(
             self,
             record: LogRecord
     ) -> None:
         """
-        Emits the log message to the database.
+        Buffers the log message to be written to the database.
 
         Args:
             record (LogRecord): The log record to emit.
@@ -180,16 +288,194 @@ class DatabaseHandler(Handler):
         Returns:
             None
         """
-        with self._connection.cursor() as cursor:
-            cursor.execute(
-                "INSERT INTO logs (level, module, message) VALUES (%s, %s, %s)",
-                (
-                    record.levelno,
-                    record.name,
-                    record.msg
-                )
-            )
-            self._connection.commit()
+        try:
+            # The formatters of the stream and file handlers usually have already stored the formatted message on the
+            # record, so it is reused rather than formatted again
+            message: str = getattr(record, "message", None) or record.getMessage()
+            self._buffer.append((record, message))
+        except Exception:
+            self.handleError(record)
+            return
+
+        if len(self._buffer) >= self.batchSize or record.levelno >= self.flushLevel:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes the buffered log messages to the database in a single transaction. If the database cannot be reached
+        the write is retried a few times before the batch is dropped and the error reported through handleError.
+
+        Returns:
+            None
+        """
+        self.acquire()
+        try:
+            if not self._buffer:
+                return
+
+            batch: list[tuple[LogRecord, str]] = self._buffer
+            self._buffer = []
+            rows: list[tuple[float, int, str, str]] = [
+                (record.created, record.levelno, record.name, message) for record, message in batch
+            ]
+
+            for attempt in range(self.retries):
+                try:
+                    with self._connection:
+                        # Losing the last few log rows in a crash is acceptable, so don't wait for the commit to be
+                        # flushed
+                        self._cursor.execute("SET LOCAL synchronous_commit TO OFF")
+                        execute_values(
+                            self._cursor, self._insertSql, rows, template=self._insertTemplate,
+                            page_size=self.batchSize
+                        )
+                    return
+
+                except OperationalError:
+                    if attempt < self.retries - 1:
+                        sleep(self.retryDelay * 2 ** attempt)
+                        continue
+                    self.handleError(batch[0][0])
+
+                except Exception:
+                    self.handleError(batch[0][0])
+                    return
+        finally:
+            self.release()
+
+
+class RecordQueueHandler(QueueHandler):
+    """
+    A queue handler that queues log records as they are. The standard QueueHandler formats the message before queueing
+    it, which would put that work back on the logging thread.
+    """
+
+    def prepare(
+            self,
+            record: LogRecord
+    ) -> LogRecord:
+        """
+        Prepares the log record for queueing.
+
+        Args:
+            record (LogRecord): The log record to prepare.
+
+        Returns:
+            LogRecord: The log record, unchanged.
+        """
+        return record
+
+
+class DatabaseQueueListener(QueueListener):
+    """
+    A queue listener that also flushes its handlers every flush interval, whether or not records are still arriving,
+    and before it stops. Buffered records are written on the listener's own thread rather than on a timer thread.
+    """
+    # Buffered records are flushed at least this often
+    flushInterval: float = 1.0
+
+    # When the handlers are next due to be flushed, the first wait flushes straight away and sets the real deadline
+    _flushDeadline: float = 0.0
+
+    def dequeue(
+            self,
+            block: bool
+    ) -> LogRecord:
+        """
+        Gets the next record from the queue, flushing the handlers while waiting for one.
+
+        Args:
+            block (bool): Whether to wait for a record.
+
+        Returns:
+            LogRecord: The next record, or the sentinel once the listener is stopping.
+        """
+        if not block:
+            return self.queue.get_nowait()
+
+        while True:
+            # Only wait until the next flush is due, so a steady trickle of records cannot hold the flush back
+            timeout: float = self._flushDeadline - monotonic()
+            if timeout <= 0:
+                self._flushHandlers()
+                continue
+
+            try:
+                record: LogRecord = self.queue.get(timeout=timeout)
+            except Empty:
+                self._flushHandlers()
+                continue
+
+            if record is self._sentinel:  # Write whatever is buffered before the listener thread exits
+                self._flushHandlers()
+            return record
+
+    def _flushHandlers(self) -> None:
+        """
+        Flushes all of the listener's handlers and sets when they are next due to be flushed.
+
+        Returns:
+            None
+        """
+        for handler in self.handlers:
+            handler.flush()
+        self._flushDeadline = monotonic() + self.flushInterval
+
+
+# Database queue handlers that have already been created, shared between loggers so each connection and level only
+# gets one listener thread
+_databaseQueueHandlers: dict[tuple[Connection, int], RecordQueueHandler] = {}
+_databaseQueueHandlersLock: Lock = Lock()
+
+
+def getDatabaseQueueHandler(
+        connection: Connection,
+        level: int = NOTSET
+) -> RecordQueueHandler:
+    """
+    Gets the database queue handler for the given connection and level, creating it on the first call.
+
+    Args:
+        connection (Connection): The connection to the database.
+        level (int): The minimum level of the records to write to the database.
+
+    Returns:
+        RecordQueueHandler: The queue handler to attach to a logger.
+    """
+    with _databaseQueueHandlersLock:
+        queueHandler: RecordQueueHandler | None = _databaseQueueHandlers.get((connection, level))
+        if queueHandler is None:
+            queueHandler = _databaseQueueHandlers[(connection, level)] = createDatabaseQueueHandler(connection, level)
+        return queueHandler
+
+
+def createDatabaseQueueHandler(
+        connection: Connection,
+        level: int = NOTSET
+) -> RecordQueueHandler:
+    """
+    Creates a queue handler that passes log records to a DatabaseHandler running on a DatabaseQueueListener thread,
+    so database writes never happen on the thread that logged the message. Use getDatabaseQueueHandler to share one
+    between loggers.
+
+    Args:
+        connection (Connection): The connection to the database.
+        level (int): The minimum level of the records to write to the database.
+
+    Returns:
+        RecordQueueHandler: The queue handler to attach to a logger.
+    """
+    recordQueue: Queue[LogRecord] = Queue(-1)
+    listener: DatabaseQueueListener = DatabaseQueueListener(
+        recordQueue, DatabaseHandler(connection, level), respect_handler_level=True
+    )
+    listener.start()
+    registerExitHandler(listener.stop)  # Stopping the listener writes any records that are still buffered
+
+    # The level is set on the queue handler too, so records below it are rejected before they are ever queued
+    queueHandler: RecordQueueHandler = RecordQueueHandler(recordQueue)
+    queueHandler.setLevel(level)
+    return queueHandler
 
 
 # Custom LoggerAdapter that can be disabled
@@ -215,14 +501,21 @@ class SuppressedLoggerAdapter(LoggerAdapter):
         super().__init__(logger, extra)
         self.suppressed = False
 
-    def __del__(self) -> None:
+    def isEnabledFor(
+            self,
+            level: int
+    ) -> bool:
         """
-        This method is called when the object is deleted.
+        Checks whether a message of the given level would be logged. A suppressed adapter logs nothing, so callers that
+        check this before building expensive log arguments skip that work too.
+
+        Args:
+            level (int): The level to check.
 
         Returns:
-            None
+            bool: Whether a message of the given level would be logged.
         """
-        del self
+        return not self.suppressed and self.logger.isEnabledFor(level)
 
     def log(
             self,
@@ -243,15 +536,20 @@ class SuppressedLoggerAdapter(LoggerAdapter):
         Returns:
             None
         """
-        if not self.suppressed:
-            super().log(level, msg, *args, **kwargs)
+        # Return before any of the adapter's processing if the message would be dropped anyway
+        if not self.isEnabledFor(level):
+            return
+
+        super().log(level, msg, *args, **kwargs)
 
 
 def createLogger(
         name: str,
         level: str = "DEBUG",
         databaseConnection: Connection = None,
-        formatString: str = "[%(asctime)s] [%(loggername)s] [%(levelname)s] %(message)s",
+        databaseLevel: int = NOTSET,
+        formatString: str = "[{asctime}] [{loggername}] [{levelname}] {message}",
+        formatStyle: Literal["%", "{", "$"] = "{",
         handlers: list[Handler] = None,
         doColour: bool = True,
         colourCoding: dict[str, str] = None
@@ -262,8 +560,12 @@ def createLogger(
     Args:
         name (str): The _name of the logger.
         level (str): The level of the logger.
-        databaseConnection (Connection): The connection to the database. Only required if the database handler is used.
+        databaseConnection (Connection): The connection to write log records to. Only required if the database handler is
+            used. It must be dedicated to logging and not used for anything else, see DatabaseHandler.
+        databaseLevel (int): The minimum level of the records to write to the database. Defaults to writing every record
+            the logger lets through.
         formatString (str): The format string for the logger.
+        formatStyle (str): The style of the format string.
         handlers (list): Additional handlers for the logger.
         doColour (bool): Whether to use colour coding in the logger for logging outputs.
         colourCoding (dict): The colour coding for the logger. Defaults to the default colour coding defined in the
@@ -272,29 +574,14 @@ def createLogger(
     Returns:
         logger (SuppressedLoggerAdapter): The logger object.
     """
-    if not path.exists(Path(f"{getcwd()}/Logs/")):
-        mkdir(Path(f"{getcwd()}/Logs/"))
-
-    loggingDirectory: str = name
-    logFileName: str = name + "_"
-
-    # Check if the logging directory exists, if not, create it
-    if not path.exists(Path(f"{getcwd()}/Logs/{loggingDirectory}")):
-        mkdir(Path(f"{getcwd()}/Logs/{loggingDirectory}"))
-
-    match level.lower():
-        case "debug":
-            level = DEBUG
-        case "info":
-            level = INFO
-        case "warning":
-            level = WARNING
-        case "error":
-            level = ERROR
-        case "critical":
-            level = CRITICAL
-        case _:
-            raise ValueError("Invalid level specified")
+    # Create the logging directory, along with the Logs directory itself, if they do not exist
+    loggingDirectory: Path = Path.cwd() / "Logs" / name
+    loggingDirectory.mkdir(parents=True, exist_ok=True)
+
+    try:
+        level: int = _levels[level.lower()]
+    except KeyError:
+        raise ValueError("Invalid level specified") from None
 
     logger: Logger = getLogger(name)  # Sets the logger's _name
     logger.setLevel(level)  # Sets the logger's level
@@ -306,24 +593,26 @@ def createLogger(
     if handlers is None:
         handlers: list[Handler] = [
             FileHandler(
-                Path(
-                    f"{getcwd()}/Logs/{loggingDirectory}/{logFileName}{datetime.now().strftime('%d.%m.%Y')}.log"
-                ),
+                loggingDirectory / f"{name}_{datetime.now():%d.%m.%Y}.log",
                 encoding="utf-8"
             ),
             StreamHandler(
                 stdout
-            ),
-            DatabaseHandler(
-                connection=databaseConnection
             )
         ]
+        if databaseConnection is not None:
+            handlers.append(getDatabaseQueueHandler(databaseConnection, databaseLevel))
 
-    colourFormatter: ColourCodedFormatter = ColourCodedFormatter(formatString, colourCoding=colourCoding)
-    formatter: Formatter = Formatter(formatString)
+    colourFormatter: ColourCodedFormatter = ColourCodedFormatter(
+        formatString, style=formatStyle, colourCoding=colourCoding
+    )
+    formatter: Formatter = CachedTimeFormatter(formatString, style=formatStyle)
 
     for handler in handlers:
-        if not doColour or isinstance(handler, FileHandler):
+        if isinstance(handler, QueueHandler):  # Records are formatted by the handlers on the other side of the queue
+            logger.addHandler(handler)
+
+        elif not doColour or isinstance(handler, FileHandler):
             handler.setFormatter(formatter)
             logger.addHandler(handler)
             pass
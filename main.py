@@ -2,19 +2,24 @@
 # The discord fork used in this bot is py-cord
 
 # Standard Library imports
+from asyncio import Semaphore, Task, create_task, gather
+from collections import Counter
 from os import environ, getcwd
 from pathlib import Path
+from sys import exit
+from typing import Callable, Coroutine
 
 # Third party imports
 from discord import Intents, Bot, ActivityType, Game, Activity, option, Forbidden, Embed, Color, NotFound, \
     DMChannel, ApplicationContext, Message, User, ApplicationCommandError, Reaction, Member, CategoryChannel, \
-    SlashCommandGroup
+    SlashCommandGroup, abc, BaseActivity
+from discord.ext import tasks
 from dotenv import load_dotenv as loadDotenv
 
 # Internal imports
-from internals.config import Config
-from internals.database import Database
-from internals.logging_ import createLogger, SuppressedLoggerAdapter
+from internals.config import Config, getConfig
+from internals.database import Database, UserStats
+from internals.logging import createLogger, SuppressedLoggerAdapter
 
 # Load .env
 loadDotenv()
@@ -29,7 +34,7 @@ if not Path("Logs").exists():
     raise FileNotFoundError(f"Logs directory not found. Cwd: {getcwd()}")
 
 # Create required objects
-config: Config = Config(Path("BotData/config.json"))
+config: Config = getConfig()
 logger: SuppressedLoggerAdapter = createLogger("Main", config.loggingLevel)
 
 database: Database = Database(config=config)  # TODO: Swap over to using postgres
@@ -49,11 +54,46 @@ reactionsGroup: SlashCommandGroup = bot.create_group(name="reactions", descripti
 roleReactionGroup: SlashCommandGroup = bot.create_group(name="rolereactions", description="Commands for managing role reactions")
 auditGroup: SlashCommandGroup = bot.create_group(name="audit", description="Commands used for auditing bot values and data")
 
+# Builds the activity for each status type
+statusActivities: dict[str, Callable[[str], BaseActivity]] = {
+    "playing": lambda status: Game(name=status),
+    "watching": lambda status: Activity(type=ActivityType.watching, name=status),
+    "listening": lambda status: Activity(type=ActivityType.listening, name=status),
+    "streaming": lambda status: Activity(type=ActivityType.streaming, name=status),
+}
+
+# Holds references to running event handler tasks so they are not garbage collected before they finish
+pendingTasks: set[Task] = set()
+
 """
 Helper functions.
 """
 
 
+def spawnTask(coroutine: Coroutine) -> None:
+    """
+    Schedules a coroutine to run as a detached task so the event dispatcher does not wait for it to finish.
+
+    Args:
+        coroutine(Coroutine): The coroutine to run
+    """
+    task: Task = create_task(coroutine)
+    pendingTasks.add(task)
+    task.add_done_callback(taskDone)
+
+
+def taskDone(task: Task) -> None:
+    """
+    Cleans up a finished task spawned with spawnTask and logs any exception it raised.
+
+    Args:
+        task(Task): The finished task
+    """
+    pendingTasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Exception in task {task.get_name()}", exc_info=task.exception())
+
+
 def checkForGifClassifier(message: str) -> bool:
     """
     Checks if the message contains a gif classifier.
@@ -64,14 +104,17 @@ def checkForGifClassifier(message: str) -> bool:
     Returns:
         bool: Whether the message contains a gif classifier
     """
-    logger.debug(f"Checking if message contains gif classifier message: {message}")
-    logger.debug(f"gifClassifiers: {config.gifClassifiers}")
-    for classifier in config.gifClassifiers:
-        if classifier in message and message not in database.whitelistedGifs:
-            logger.debug(f"Message contains gif classifier {classifier}")
-            return True
+    logger.debug("Checking if message contains gif classifier message: %s", message)
+    logger.debug("gifClassifiers: %s", config.gifClassifiers)
+    if message in database.whitelistedGifs:
+        logger.debug("Message is a whitelisted gif")
+        return False
 
-    logger.debug(f"Message does not contain gif classifier")
+    if config.gifClassifierPattern is not None and config.gifClassifierPattern.search(message) is not None:
+        logger.debug("Message contains gif classifier")
+        return True
+
+    logger.debug("Message does not contain gif classifier")
     return False
 
 
@@ -107,11 +150,11 @@ async def addException(ctx: ApplicationContext, link: str) -> None:
         await ctx.respond("You are not an admin!", ephemeral=True)
         return
 
-    if link in database.whitelistedGifs:
+    if await database.run(lambda: link in database.whitelistedGifs):
         await ctx.respond("This gif is already whitelisted!")
         return
 
-    database.addWhitelistedGif(ctx.author.id, link)
+    await database.run(database.addWhitelistedGif, ctx.author.id, link)
     await ctx.respond("Gif whitelisted!")
 
 
@@ -132,11 +175,11 @@ async def removeException(ctx: ApplicationContext, link: str) -> None:
         await ctx.respond("You are not an admin!", ephemeral=True)
         return
 
-    if link not in database.whitelistedGifs:
+    if not await database.run(lambda: link in database.whitelistedGifs):
         await ctx.respond("This gif is not whitelisted!")
         return
 
-    database.removeWhitelistedGif(link)
+    await database.run(database.removeWhitelistedGif, link)
     await ctx.respond("Gif unwhitelisted!")
 
 
@@ -178,14 +221,14 @@ async def banGif(ctx: ApplicationContext, link: str, reason: str) -> None:
         await ctx.respond("You are not an admin!", ephemeral=True)
         return
 
-    if database.checkGifBanned(link):
+    if await database.run(database.checkGifBanned, link):
         await ctx.respond("This gif is already banned!")
         return
 
     if reason is None:
         reason = "No reason given"
 
-    database.addBannedGif(ctx.author.id, link, reason)
+    await database.run(database.addBannedGif, ctx.author.id, link, reason)
     await ctx.respond("Gif banned!")
 
 
@@ -206,11 +249,11 @@ async def unbanGif(ctx: ApplicationContext, link: str) -> None:
         await ctx.respond("You are not an admin!", ephemeral=True)
         return
 
-    if not database.checkGifBanned(link):
+    if not await database.run(database.checkGifBanned, link):
         await ctx.respond("This gif is not banned!")
         return
 
-    database.removeBannedGif(link)
+    await database.run(database.removeBannedGif, link)
     await ctx.respond("Gif unbanned!")
 
 
@@ -261,7 +304,7 @@ async def addReaction(ctx, user: User, reaction: str):
     logger.info(f"User {ctx.author.name}({ctx.author.id}) adding reaction {reaction} to user "
                 f"{user.name}({user.id})")
 
-    database.addReaction(reaction, ctx.author.id, user.id)
+    await database.run(database.addReaction, reaction, ctx.author.id, user.id)
     await ctx.respond(f"Added reaction {reaction} to user <@{user.id}>!")
 
 
@@ -288,7 +331,7 @@ async def removeReaction(ctx, user: User, reaction: str):
         f"User {ctx.author.name}({ctx.author.id}) removing reaction {reaction} from user "
         f"{user.name}({user.id})")
 
-    database.removeReaction(reaction, user.id)
+    await database.run(database.removeReaction, reaction, user.id)
     await ctx.respond(f"Removed reaction {reaction} from user <@{user.id}>!")
 
 
@@ -312,16 +355,15 @@ async def listReactions(ctx, user: User):
     logger.info(
         f"User {ctx.author.name}({ctx.author.id}) listing reactions for user {user.name}({user.id})")
 
-    reactions = database.getUserReactions(user.id)
+    reactions = await database.run(database.getUserReactions, user.id)
     if len(reactions) == 0:
         logger.info(f"No reactions found for user {user.name}({user.id})")
         await ctx.respond(f"No reactions found for user <@{user.id}>!")
         return
 
-    for react in reactions:
-        reactions[reactions.index(react)] = f"{react[0]}"
-    logger.debug(f"Reactions for user {user.name}({user.id}) are {', '.join(reactions)}")
-    await ctx.respond(f"Reactions for user <@{user.id}> are {', '.join(reactions)}")
+    reactionList: str = ", ".join(reactions)
+    logger.debug("Reactions for user %s(%s) are %s", user.name, user.id, reactionList)
+    await ctx.respond(f"Reactions for user <@{user.id}> are {reactionList}")
 
 
 @bot.command(
@@ -345,20 +387,19 @@ async def getMessageCount(ctx, user: User, type: str = "sent"):
     logger.info(
         f"User {ctx.author.name}({ctx.author.id}) getting {type} message count for user {user.name}"
         f"({user.id})")
-    if not database.checkUserExists(user.id):
+    if type not in ("sent", "deleted"):
+        await ctx.respond("Invalid message count type!", ephemeral=True)
+        return
+
+    stats: UserStats | None = await database.run(database.getUserStats, user.id)
+    if stats is None:
         logger.info(f"User {user.name}({user.id}) does not exist")
         await ctx.respond(f"User <@{user.id}> does not exist!")
         return
 
-    if type == "sent":
-        count = database.getMessagesSent(user.id)
-    elif type == "deleted":
-        count = database.getMessagesDeleted(user.id)
-    else:
-        await ctx.respond("Invalid message count type!", ephemeral=True)
-        return
+    count: int = stats.messagesSent if type == "sent" else stats.messagesDeleted
 
-    logger.debug(f"User {user.name}({user.id}) has {type} {count} messages")
+    logger.debug("User %s(%s) has %s %s messages", user.name, user.id, type, count)
     await ctx.respond(f"User <@{user.id}> has {type} {count} messages!")
 
 
@@ -382,9 +423,9 @@ async def messagesLeaderboard(ctx, type: str = "sent", count: int = 10):
     """
     logger.info(f"User {ctx.author.name}({ctx.author.id}) getting {type} messages leaderboard")
     if type == "sent":
-        users = database.getTopMessagesSent(count)
+        users = await database.run(database.getTopMessagesSent, count)
     elif type == "deleted":
-        users = database.getTopMessagesDeleted(count)
+        users = await database.run(database.getTopMessagesDeleted, count)
     else:
         await ctx.respond("Invalid message count type!", ephemeral=True)
         return
@@ -407,6 +448,36 @@ async def messagesLeaderboard(ctx, type: str = "sent", count: int = 10):
     await ctx.respond(embed=embed)
 
 
+async def countChannelMessages(channel: abc.GuildChannel, semaphore: Semaphore) -> Counter[int]:
+    """
+    Counts the messages sent by each user in a channel.
+
+    Args:
+        channel (abc.GuildChannel): The channel to count the messages in
+        semaphore (Semaphore): The semaphore limiting how many channels are read at once
+
+    Returns:
+        Counter[int]: The number of messages sent in the channel by each user ID
+    """
+    logger.debug("Getting message count for channel %s(%s) in %s(%s)", channel.name, channel.id, channel.guild.name,
+                 channel.guild.id)
+    channelCount: Counter[int] = Counter()
+
+    async with semaphore:
+        try:
+            async for message in channel.history(limit=None):
+                channelCount[message.author.id] += 1
+
+        except Forbidden:
+            logger.error(f"Bot does not have permission to read messages in {channel.name}({channel.id}) in "
+                         f"{channel.guild.name}({channel.guild.id})")
+
+        except NotFound:
+            logger.error(f"Channel {channel.name}({channel.id}) not found in {channel.guild.name}({channel.guild.id})")
+
+    return channelCount
+
+
 @auditGroup.command(
     name="messages",
     description="Audits message count for all sent in all servers. Can only be run by the bot owner."
@@ -425,56 +496,25 @@ async def audit(ctx: ApplicationContext) -> None:
 
     await ctx.respond(f"Auditing message count for all servers. This may take a while.")
 
-    # Create a message count object
-    messageCount: dict[int, dict[int, dict[int, int]]] = {}
-
-    # Get all guilds
-    for guild in bot.guilds:
-        logger.debug(f"Getting message count for guild {guild.name}({guild.id})")
-        messageCount[guild.id] = {}
-
-        # Get all channels
-        for channel in guild.channels:
-            logger.debug(f"Getting message count for channel {channel.name}({channel.id}) in {guild.name}({guild.id})")
-            messageCount[guild.id][channel.id] = {}
-
-            # Get all members in the guild
-            for member in guild.members:
-                messageCount[guild.id][channel.id][member.id] = 0
-
-            # Get all messages in the channel
-            if not isinstance(channel, CategoryChannel):
-                try:
-                    async for message in channel.history(limit=999999999999999999999999999999999999999999999999999999):
-                        try:
-                            messageCount[guild.id][channel.id][message.author.id] += 1
-
-                        except KeyError:
-                            messageCount[guild.id][channel.id][message.author.id] = 1
-                except Forbidden:
-                    logger.error(f"Bot does not have permission to read messages in {channel.name}({channel.id}) in "
-                                 f"{guild.name}({guild.id})")
-
-                except NotFound:
-                    logger.error(f"Channel {channel.name}({channel.id}) not found in {guild.name}({guild.id})")
-
-    # Count all messages in the messageCount object from every user globally
-    users: dict[int, int] = {}
-    for guild in messageCount:
-        logger.debug(f"Counting messages for guild {guild}")
-        for channel in messageCount[guild]:
-            for user in messageCount[guild][channel]:
-                if user not in users:
-                    users[user] = 0
-                users[user] += messageCount[guild][channel][user]
+    # Count the messages in every channel concurrently, the semaphore limits how many histories are fetched at once to
+    # stay within discord's rate limits
+    semaphore: Semaphore = Semaphore(5)
+    channels: list[abc.GuildChannel] = [
+        channel for guild in bot.guilds for channel in guild.channels if not isinstance(channel, CategoryChannel)
+    ]
+    results: list[Counter[int]] = await gather(*(countChannelMessages(channel, semaphore) for channel in channels))
 
-    # Update the database with the new message counts
-    for user in users:
-        logger.debug(f"Updating message count for user {user}")
-        if not database.checkUserExists(user):
-            database.addUser(user, bot.get_user(user).name if bot.get_user(user) is not None else "deleted user")
+    # Count all messages from every user globally
+    users: Counter[int] = Counter()
+    for channelCount in results:
+        users.update(channelCount)
 
-        database.setMessagesSent(user, users[user])
+    # Update the database with the new message counts
+    logger.debug("Updating message count for %s users", len(users))
+    await database.run(database.setMessagesSentBulk, [
+        (user, discordUser.name if (discordUser := bot.get_user(user)) is not None else "deleted user", count)
+        for user, count in users.items()
+    ])
 
     await ctx.respond("Audit complete!")
 
@@ -499,10 +539,13 @@ async def auditUsernames(ctx: ApplicationContext) -> None:
     await ctx.respond(f"Auditing usernames for all users in all servers. This may take a while.")
 
     # Get all users in the database and check that their usernames are up to date
-    for user in database.users:
-        if bot.get_user(user[0]) is not None:
-            if user[1] != bot.get_user(user[0]).name:
-                database.setUsername(user[0], bot.get_user(user[0]).name)
+    updates: list[tuple[str, int]] = []
+    for user in await database.run(lambda: database.users):
+        discordUser: User | None = bot.get_user(user[0])
+        if discordUser is not None and user[1] != discordUser.name:
+            updates.append((discordUser.name, user[0]))
+
+    await database.run(database.setUsernameBulk, updates)
 
 """
 Bot Events
@@ -513,57 +556,74 @@ Bot Events
 @bot.event
 async def on_message(message: Message) -> None:
     """
-    The on message event for the bot.
+    The on message event for the bot. The message is handled in a separate task so slow handlers do not hold up other
+    events.
+
+    Args:
+        message (Message): The context of the message
+    """
+    # The bot's own messages are not counted or filtered
+    if message.author.id == bot.user.id:
+        return
+
+    spawnTask(handleMessage(message))
+
+
+async def handleMessage(message: Message) -> None:
+    """
+    Handles a message sent in a channel the bot can see.
 
     Args:
         message (Message): The context of the message
     """
     # This has all been rewritten, I believe it is as readable as it can be
-    if message.channel is DMChannel:  # This might not work, if it does not use isinstance()
-        logger.info(f"Message from {message.author.name}({message.author.id} in DMs")
+    if isinstance(message.channel, DMChannel):
+        logger.info("Message from %s(%s) in DMs", message.author.name, message.author.id)
 
     else:
         logger.info(
-            f"Message({message.id}) from {message.author.name}({message.author.id}) in {message.channel.name}({message.channel.id})"
-            f"in {message.guild.name}({message.guild.id}): "
-            f"{message.content}")
+            "Message(%s) from %s(%s) in %s(%s) in %s(%s): %s",
+            message.id, message.author.name, message.author.id, message.channel.name, message.channel.id,
+            message.guild.name, message.guild.id, message.content
+        )
 
     # Check if the user is in the database
-    if not database.checkUserExists(message.author.id):
-        database.addUser(message.author.id, message.author.name)
+    if not await database.run(database.checkUserExists, message.author.id):
+        await database.run(database.addUser, message.author.id, message.author.name)
 
-    # Increment the messages count
-    database.incrementMessagesSent(message.author.id)
+    # Increment the messages count, flushing early if a lot of counts are pending
+    if database.incrementMessagesSent(message.author.id):
+        await database.run(database.flushMessagesSent)
 
-    if message.author.id == bot.user.id:
-        return
-
-    # Perform banned gifs check
-    if database.checkMessageBannedGifs(message.content) and message.author.id not in config.owonerId:
-        logger.info(f"Deleting message {message.id}, contains banned gif.")
+    # Perform banned gifs check, owners are exempt so the cheap owner check runs before scanning the message
+    if message.author.id not in config.owonerId and await database.run(database.checkMessageBannedGifs, message.content):
+        logger.info("Deleting message %s, contains banned gif.", message.id)
         await message.delete(reason="Contains banned gif.")
         await message.channel.send(f"{message.author.mention} no.")
 
     # Run reply filter
     if message.reference is not None and not message.is_system():  # Only these two checks are run here for optimization
-        if message.reference.resolved.author.id in database.filteredUsers and not database.checkUserAdmin(
-                message.author) \
-                and checkForGifClassifier(message.content):
-            logger.debug(f"Message is a reply to a message from a filtered user, deleting")
+        if message.reference.resolved.author.id in await database.run(lambda: database.filteredUsers) \
+                and not database.checkUserAdmin(message.author) \
+                and await database.run(checkForGifClassifier, message.content):
+            logger.debug("Message is a reply to a message from a filtered user, deleting")
             await message.delete()
             await message.channel.send(f"{message.author.mention} no.")
 
     # Handle reactions
-    userReactions: list[str] = database.getUserReactions(message.author.id)
-    if userReactions is not None:
-        logger.debug(f"User {message.author.name}({message.author.id}) has reactions {userReactions}")
-        for reaction in userReactions:
-            logger.info(f"Adding reaction {reaction[0]} to message {message.id}")
-            try:
-                await message.add_reaction(reaction[0])
-
+    userReactions: tuple[str, ...] = await database.run(database.getUserReactions, message.author.id)
+    if userReactions:
+        logger.debug("User %s(%s) has reactions %s", message.author.name, message.author.id, userReactions)
+
+        # Add the reactions concurrently, the semaphore keeps the requests within discord's rate limits
+        semaphore: Semaphore = Semaphore(5)
+        results: list[BaseException | None] = await gather(
+            *(addReactionLimited(message, reaction, semaphore) for reaction in userReactions),
+            return_exceptions=True
+        )
+        for result in results:
             # When the bot does not have permission to add reactions or the user has blocked the bot
-            except Forbidden:
+            if isinstance(result, Forbidden):
                 logger.error(
                     f"Bot does not have permission to add reactions in {message.channel.name}({message.channel.id}) in "
                     f"{message.guild.name}({message.guild.id}) OR {message.author.name}({message.author.id}) has "
@@ -571,12 +631,29 @@ async def on_message(message: Message) -> None:
                 )
 
             # When the message has been deleted
-            except NotFound:
+            elif isinstance(result, NotFound):
                 logger.error(
                     f"Message {message.id} not found in {message.channel.name}({message.channel.id}) in "
                     f"{message.guild.name}({message.guild.id})"
                 )
 
+            elif result is not None:
+                raise result
+
+
+async def addReactionLimited(message: Message, emoji: str, semaphore: Semaphore) -> None:
+    """
+    Adds a reaction to a message once the semaphore allows it.
+
+    Args:
+        message (Message): The message to add the reaction to
+        emoji (str): The reaction to add
+        semaphore (Semaphore): The semaphore limiting how many reactions are added at once
+    """
+    async with semaphore:
+        logger.info("Adding reaction %s to message %s", emoji, message.id)
+        await message.add_reaction(emoji)
+
 
 @bot.event
 async def on_message_delete(message: Message) -> None:
@@ -593,9 +670,9 @@ async def on_message_delete(message: Message) -> None:
     )
 
     logger.debug("Checking if user exists in database")
-    if not database.checkUserExists(message.author.id):
+    if not await database.run(database.checkUserExists, message.author.id):
         logger.debug("User does not exist, adding to database")
-        database.addUser(message.author.id, message.author.name)
+        await database.run(database.addUser, message.author.id, message.author.name)
 
 
 @bot.event
@@ -607,9 +684,23 @@ async def on_reaction_add(reaction: Reaction, user: Member | User) -> None:
         reaction (Reaction): The reaction that was added
         user (Member | User): The user that added the reaction
     """
-    logger.info(f"Reaction {reaction.emoji} added by {user.name}({user.id}) to message {reaction.message.id} in "
-                f"{reaction.message.channel.name}({reaction.message.channel.id}) in "
-                f"{reaction.message.guild.name}({reaction.message.guild.id})")
+    spawnTask(handleReactionAdd(reaction, user))
+
+
+async def handleReactionAdd(reaction: Reaction, user: Member | User) -> None:
+    """
+    Handles a reaction being added to a message.
+
+    Args:
+        reaction (Reaction): The reaction that was added
+        user (Member | User): The user that added the reaction
+    """
+    logger.info(
+        "Reaction %s added by %s(%s) to message %s in %s(%s) in %s(%s)",
+        reaction.emoji, user.name, user.id, reaction.message.id,
+        reaction.message.channel.name, reaction.message.channel.id,
+        reaction.message.guild.name, reaction.message.guild.id
+    )
 
     # TODO: Implement reaction roles
 
@@ -626,6 +717,32 @@ async def on_command_error(ctx: ApplicationContext, error: ApplicationCommandErr
     await ctx.respond(f"Exception in slash command {ctx.command.name}:\n{error}")
 
 
+@bot.event
+async def on_disconnect() -> None:
+    """
+    The on disconnect event for the bot. Writes out pending message counts in case the bot is shutting down.
+    """
+    await database.run(database.flushMessagesSent)
+    config.flush()
+
+
+@tasks.loop(seconds=30)
+async def flushMessagesSent() -> None:
+    """
+    Periodically writes the message counts collected since the last flush to the database.
+    """
+    await database.run(database.flushMessagesSent)
+
+
+@tasks.loop(seconds=5)
+async def flushConfig() -> None:
+    """
+    Periodically writes any config changes to the config file, so rapid changes are coalesced into a single write.
+    """
+    if config.dirty:
+        config.flush()
+
+
 @bot.event  # This is working properly
 async def on_ready():
     """
@@ -633,24 +750,31 @@ async def on_ready():
     """
     logger.info(f"Logged in as {bot.user.name}({bot.user.id})")
 
+    if not flushMessagesSent.is_running():
+        flushMessagesSent.start()
+    if not flushConfig.is_running():
+        flushConfig.start()
+
     try:
         await setStatusInternal()
-    except TypeError as error:
-        exit(error.__cause__)
-
-    # Get all users in all server the bot is in
-    users: list[Member] = []
-    for guild in bot.guilds:
-        users.extend(guild.members)
-
-    for user in users:
-        if not database.checkUserExists(user.id):
-            database.addUser(user.id, user.name)
+    except TypeError:
+        logger.exception("Failed to set the status from the config")
+        exit(1)
+
+    # Add any users in the servers the bot is in that are not in the database yet
+    existingUsers: set[int] = await database.run(database.getUserIds)
+    missingUsers: dict[int, str] = {
+        member.id: member.name
+        for guild in bot.guilds
+        for member in guild.members
+        if member.id not in existingUsers
+    }
+    await database.run(database.addUsers, list(missingUsers.items()))
 
     # TODO: Add a users check to ensure all users are in the database and then prompt 537400103044907028 asking if they
     #  want to count all messages for all users
 
-    logger.debug(f"Status set to {config.statusType.title()} {config.status}!")
+    logger.debug("Status set to %s %s!", config.statusType.title(), config.status)
 
     logger.info("Bot ready!")
 
@@ -662,19 +786,14 @@ async def setStatusInternal():
     Raises:
         TypeError: If the statusType is invalid.
     """
-    match config.statusType.lower():
-        case "playing":
-            await bot.change_presence(activity=Game(name=config.status))
-        case "watching":
-            await bot.change_presence(activity=Activity(type=ActivityType.watching, name=config.status))
-        case "listening":
-            await bot.change_presence(activity=Activity(type=ActivityType.listening, name=config.status))
-        case "streaming":
-            await bot.change_presence(activity=Activity(type=ActivityType.streaming, name=config.status))
-        case _:
-            return TypeError("Invalid statusType")
+    createActivity: Callable[[str], BaseActivity] | None = statusActivities.get(config.statusType.lower())
+    if createActivity is None:
+        raise TypeError("Invalid statusType")
+
+    await bot.change_presence(activity=createActivity(config.status))
 
 
 if __name__ == '__main__':
     logger.info("Starting bot...")
     bot.run(token)
+    config.flush()
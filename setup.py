@@ -5,34 +5,42 @@ Quickstart script for setting up the project structure, logging, and database.
 # Standard Imports
 from pathlib import Path
 from sqlite3 import connect
-from os import mkdir
 
-# Create Logs Directory
-try:
-    mkdir("Logs")
-except FileExistsError:
-    pass
-try:
-    mkdir("BotData")
-except FileExistsError:
-    pass
 
+def main() -> None:
+    """
+    Creates the project directories, the database, and the default config file. Anything that already exists is left
+    as it is, so this is safe to run again.
+    """
+    # Create Logs and BotData Directories
+    Path("Logs").mkdir(exist_ok=True)
+    Path("BotData").mkdir(exist_ok=True)
 
-# Create Database
-with connect("BotData/database.db") as conn:
-    cursor = conn.cursor()
-    cursor.execute("""create table users
+    # Create Database
+    with connect("BotData/database.db") as conn:
+        cursor = conn.cursor()
+        # WAL is stored in the database file, so this only needs to be set once. The other pragmas speed up the setup
+        # itself
+        cursor.execute("pragma journal_mode=WAL;")
+        cursor.execute("pragma synchronous=NORMAL;")
+        cursor.execute("pragma temp_store=MEMORY;")
+        cursor.execute("pragma cache_size=-20000;")
+        cursor.execute("pragma busy_timeout=5000;")
+        # All of the schema is created in a single transaction
+        conn.executescript("""begin;
+create table if not exists users
 (
     id            serial                              not null
         primary key,
     username      text                                not null,
     apply_filter  boolean   default false             not null,
     messages_sent int       default 0                 not null,
+    messages_deleted int    default 0                 not null,
     banned        bool      default false             not null,
     created_at    timestamp default current_timestamp not null
 );
-""")
-    cursor.execute("""create table banned_gifs
+
+create table if not exists banned_gifs
 (
     id         integer                             not null
         constraint banned_gifs_pk
@@ -43,8 +51,8 @@ with connect("BotData/database.db") as conn:
     reason     text                                not null,
     created_at timestamp default current_timestamp not null
 );
-""")
-    cursor.execute("""create table random_reactions
+
+create table if not exists random_reactions
 (
     id       integer                             not null
         primary key autoincrement,
@@ -53,8 +61,8 @@ with connect("BotData/database.db") as conn:
         references users,
     added_at timestamp default CURRENT_TIMESTAMP not null
 );
-""")
-    cursor.execute("""create table reactions
+
+create table if not exists reactions
 (
     id         integer                             not null
         primary key autoincrement,
@@ -65,8 +73,8 @@ with connect("BotData/database.db") as conn:
         references users,
     added_on   timestamp default current_timestamp not null
 );
-""")
-    cursor.execute("""create table whitelist
+
+create table if not exists whitelist
 (
     id         integer                             not null
         constraint whitelist_pk
@@ -76,12 +84,21 @@ with connect("BotData/database.db") as conn:
         references users,
     created_at timestamp default current_timestamp not null
 );
+
+create index if not exists idx_users_messages_sent_cover on users (messages_sent desc, id, username);
+create index if not exists idx_users_messages_deleted_cover on users (messages_deleted desc, id, username);
+analyze;
+commit;
 """)
-    conn.commit()
 
-# Create Config File
-with open("BotData/config.json", "w") as file:
-    file.write("""{
+    # Create Config File, an existing config is left as it is
+    try:
+        file = open("BotData/config.json", "x")
+    except FileExistsError:
+        return
+
+    with file:
+        file.write("""{
     "status": "with the default config",
     "statusType": "playing",
     "filterEnabled": false,
@@ -94,3 +111,7 @@ with open("BotData/config.json", "w") as file:
     ],
     "loggingLevel": "INFO"
 }""")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Tests for the config.
+"""
+# Standard Library Imports
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+# Internal imports
+from internals import config as configModule
+from internals.config import Config, _readJson, _writeJson, getConfig
+
+
+class ConfigTestCase(TestCase):
+    """
+    Creates a config file in a temporary directory for each test.
+    """
+    configPath: Path
+    config: Config
+
+    def setUp(self) -> None:
+        """
+        Creates the temporary config file and loads it.
+        """
+        directory: TemporaryDirectory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.configPath = Path(directory.name) / "config.json"
+
+        _writeJson(self.configPath, {
+            "status": "with fire",
+            "statusType": "playing",
+            "gifClassifiers": [],
+            "filterEnabled": False,
+            "loggingLevel": "ERROR"
+        })
+        self.config = Config(self.configPath, Path(directory.name) / ".env")
+
+
+class LoadTests(ConfigTestCase):
+    """
+    Tests for loading the config file.
+    """
+
+    def test_valuesReadFromFile(self) -> None:
+        """
+        Values are read from the config file.
+        """
+        self.assertEqual(self.config.status, "with fire")
+        self.assertEqual(self.config.statusType, "playing")
+        self.assertIsNone(self.config.gifClassifierPattern)
+
+    def test_getConfigReturnsSameConfig(self) -> None:
+        """
+        getConfig only loads the config once, later calls return it whatever paths they are given.
+        """
+        self.addCleanup(setattr, configModule, "_config", None)
+
+        config: Config = getConfig(self.configPath)
+
+        self.assertIs(getConfig(), config)
+        self.assertIs(getConfig(self.configPath), config)
+        self.assertEqual(config.status, "with fire")
+
+
+class FlushTests(ConfigTestCase):
+    """
+    Tests for writing config changes to the config file.
+    """
+
+    def test_changesWrittenOnFlush(self) -> None:
+        """
+        Changes are held in memory until the config is flushed.
+        """
+        self.config.status = "with water"
+        self.assertTrue(self.config.dirty)
+        self.assertEqual(_readJson(self.configPath)["status"], "with fire")
+
+        self.config.flush()
+
+        self.assertFalse(self.config.dirty)
+        self.assertEqual(_readJson(self.configPath)["status"], "with water")
+
+    def test_failedFlushIsRetried(self) -> None:
+        """
+        Changes from a flush that fails stay pending and are written by the next flush.
+        """
+        self.config.status = "with water"
+
+        # A directory in the way of the temporary file makes the write fail
+        blocker: Path = self.configPath.with_suffix(".json.tmp")
+        blocker.mkdir()
+        with self.assertRaises(OSError):
+            self.config.flush()
+        self.assertTrue(self.config.dirty)
+        blocker.rmdir()
+
+        self.config.flush()
+
+        self.assertFalse(self.config.dirty)
+        self.assertEqual(_readJson(self.configPath)["status"], "with water")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""
+Tests for the sqlite database used by the bot.
+"""
+# Standard Library Imports
+from atexit import unregister as unregisterExitHandler
+from pathlib import Path
+from sqlite3 import OperationalError, connect
+from tempfile import TemporaryDirectory
+from threading import Thread
+from types import SimpleNamespace
+from unittest import TestCase, main
+
+# Internal imports
+from internals.database import Database
+
+# The users table as created by the original quickstart script, before messages_deleted was added
+_baselineUsersTable: str = """
+create table users
+(
+    id            serial                              not null
+        primary key,
+    username      text                                not null,
+    apply_filter  boolean   default false             not null,
+    messages_sent int       default 0                 not null,
+    banned        bool      default false             not null,
+    created_at    timestamp default current_timestamp not null
+);
+"""
+
+
+class DatabaseTestCase(TestCase):
+    """
+    Creates a database with the baseline users table in a temporary directory for each test.
+    """
+    databaseLocation: Path
+
+    def setUp(self) -> None:
+        """
+        Creates the temporary database.
+        """
+        directory: TemporaryDirectory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.databaseLocation = Path(directory.name) / "database.db"
+
+        with connect(self.databaseLocation) as connection:
+            connection.execute(_baselineUsersTable)
+        connection.close()
+
+    def openDatabase(self) -> Database:
+        """
+        Opens the temporary database, closing it again when the test finishes.
+
+        Returns:
+            Database: The opened database.
+        """
+        database: Database = Database(
+            SimpleNamespace(loggingLevel="ERROR", owonerId=[]), databaseLocation=self.databaseLocation
+        )
+        unregisterExitHandler(database.close)
+        self.addCleanup(database.close)
+        return database
+
+
+class MigrationTests(DatabaseTestCase):
+    """
+    Tests for the schema migrations run when the database is opened.
+    """
+
+    def test_addsMessagesDeletedColumn(self) -> None:
+        """
+        Opening a database without the messages_deleted column adds it and its index.
+        """
+        database: Database = self.openDatabase()
+
+        columns: set[str] = {column[1] for column in database.connection.execute("PRAGMA table_info(users)")}
+        self.assertIn("messages_deleted", columns)
+
+        indexes: set[str] = {index[1] for index in database.connection.execute("PRAGMA index_list(users)")}
+        self.assertIn("idx_users_messages_deleted_cover", indexes)
+
+    def test_existingUsersGetZeroMessagesDeleted(self) -> None:
+        """
+        Users that existed before the migration start with no deleted messages.
+        """
+        with connect(self.databaseLocation) as connection:
+            connection.execute("INSERT INTO users (id, username, messages_sent) VALUES (1, 'user', 5)")
+        connection.close()
+
+        database: Database = self.openDatabase()
+
+        self.assertEqual(database.getMessagesDeleted(1), 0)
+        self.assertEqual(database.getMessagesSent(1), 5)
+
+    def test_migrationRunsOnce(self) -> None:
+        """
+        Opening an already migrated database does not try to add the column again.
+        """
+        self.openDatabase()
+        database: Database = self.openDatabase()
+
+        columns: list[str] = [column[1] for column in database.connection.execute("PRAGMA table_info(users)")]
+        self.assertEqual(columns.count("messages_deleted"), 1)
+
+
+class UserTests(DatabaseTestCase):
+    """
+    Tests for adding users.
+    """
+
+    def test_addExistingUser(self) -> None:
+        """
+        Adding a user that already exists keeps the existing row instead of failing.
+        """
+        database: Database = self.openDatabase()
+
+        database.addUser(1, "user")
+        database.addUser(1, "renamed")
+
+        self.assertEqual(database.getUserName(1), "user")
+
+    def test_writeWaitsForOpenTransaction(self) -> None:
+        """
+        A write made from another thread while a transaction is open waits for it instead of joining or breaking it.
+        """
+        database: Database = self.openDatabase()
+
+        with database._transaction():
+            writer: Thread = Thread(target=database.addUser, args=(2, "other"))
+            writer.start()
+            writer.join(timeout=0.1)
+            self.assertTrue(writer.is_alive())
+
+            database.addUser(1, "user")
+
+        writer.join()
+        self.assertEqual(database.getUserIds(), {1, 2})
+
+
+class MessagesSentTests(DatabaseTestCase):
+    """
+    Tests for the buffered message counts.
+    """
+
+    def test_flushWritesPendingCounts(self) -> None:
+        """
+        Increments are held in memory until they are flushed to the database.
+        """
+        database: Database = self.openDatabase()
+        database.addUsers([(1, "user"), (2, "other")])
+
+        for uid in (1, 1, 2):
+            database.incrementMessagesSent(uid)
+        self.assertEqual(database.getMessagesSent(1), 0)
+
+        database.flushMessagesSent()
+
+        self.assertEqual(database.getMessagesSent(1), 2)
+        self.assertEqual(database.getMessagesSent(2), 1)
+
+    def test_failedFlushKeepsPendingCounts(self) -> None:
+        """
+        Counts from a flush that fails are written by the next flush, along with any made in between.
+        """
+        database: Database = self.openDatabase()
+        database.addUser(1, "user")
+        database.incrementMessagesSent(1)
+
+        # Hide the users table so the flush fails
+        database.connection.execute("ALTER TABLE users RENAME TO hidden_users")
+        with self.assertRaises(OperationalError):
+            database.flushMessagesSent()
+        database.connection.execute("ALTER TABLE hidden_users RENAME TO users")
+
+        database.incrementMessagesSent(1)
+        database.flushMessagesSent()
+
+        self.assertEqual(database.getMessagesSent(1), 2)
+
+    def test_incrementsDuringFlushesAreKept(self) -> None:
+        """
+        Increments made on one thread while another thread flushes are all written.
+        """
+        database: Database = self.openDatabase()
+        database.addUsers([(uid, "user") for uid in range(100)])
+
+        def increment() -> None:
+            """
+            Increments the message counts of every user many times.
+            """
+            for _ in range(50):
+                for uid in range(100):
+                    database.incrementMessagesSent(uid)
+
+        incrementer: Thread = Thread(target=increment)
+        incrementer.start()
+        while incrementer.is_alive():
+            database.flushMessagesSent()
+        database.flushMessagesSent()
+
+        self.assertEqual(
+            database.connection.execute("SELECT SUM(messages_sent) FROM users").fetchone()[0], 5000
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""
+Smoke tests that make sure the internals package can be imported.
+"""
+# Standard Library Imports
+from importlib import import_module
+from unittest import TestCase, main
+
+
+class ImportTests(TestCase):
+    """
+    Imports every module of the internals package.
+    """
+
+    def test_importModules(self) -> None:
+        """
+        Imports each module, failing on any error raised while the module loads.
+        """
+        for module in (
+                "internals",
+                "internals.config",
+                "internals.database",
+                "internals.datatypes",
+                "internals.errors",
+                "internals.logging"
+        ):
+            with self.subTest(module=module):
+                import_module(module)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Tests for the logging module.
+"""
+# Standard Library Imports
+from logging import Handler, INFO, LogRecord
+from os import chdir, getcwd
+from pathlib import Path
+from queue import Queue
+from tempfile import TemporaryDirectory
+from time import sleep
+from unittest import TestCase, main
+
+# Internal imports
+from internals.logging import DatabaseQueueListener, createLogger
+
+
+class RecordingHandler(Handler):
+    """
+    A handler that buffers records and keeps the ones it has flushed.
+    """
+    buffered: list[LogRecord]
+    flushed: list[LogRecord]
+
+    def __init__(self) -> None:
+        """
+        Initializes the recording handler.
+        """
+        super().__init__()
+        self.buffered = []
+        self.flushed = []
+
+    def emit(self, record: LogRecord) -> None:
+        """
+        Buffers the record.
+        """
+        self.buffered.append(record)
+
+    def flush(self) -> None:
+        """
+        Moves the buffered records to the flushed records.
+        """
+        self.flushed.extend(self.buffered)
+        self.buffered = []
+
+
+class DatabaseQueueListenerTests(TestCase):
+    """
+    Tests for flushing the handlers of the database queue listener.
+    """
+
+    def test_flushesDuringSteadyTraffic(self) -> None:
+        """
+        Records are flushed every flush interval even when new records keep arriving faster than that.
+        """
+        recordQueue: Queue[LogRecord] = Queue()
+        handler: RecordingHandler = RecordingHandler()
+        listener: DatabaseQueueListener = DatabaseQueueListener(recordQueue, handler)
+        listener.flushInterval = 0.2
+        listener.start()
+        self.addCleanup(listener.stop)
+
+        for _ in range(12):
+            recordQueue.put(LogRecord("test", INFO, __file__, 0, "message", None, None))
+            sleep(0.05)
+
+        self.assertTrue(handler.flushed)
+
+    def test_flushesOnStop(self) -> None:
+        """
+        Stopping the listener flushes any records that are still buffered.
+        """
+        recordQueue: Queue[LogRecord] = Queue()
+        handler: RecordingHandler = RecordingHandler()
+        listener: DatabaseQueueListener = DatabaseQueueListener(recordQueue, handler)
+        listener.flushInterval = 60
+        listener.start()
+
+        recordQueue.put(LogRecord("test", INFO, __file__, 0, "message", None, None))
+        listener.stop()
+
+        self.assertEqual(len(handler.flushed), 1)
+
+
+class CreateLoggerTests(TestCase):
+    """
+    Tests for creating loggers.
+    """
+
+    def test_logsStoredInWorkingDirectory(self) -> None:
+        """
+        Log files are stored under the working directory at the time the logger is created.
+        """
+        directory: TemporaryDirectory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.addCleanup(chdir, getcwd())
+        chdir(directory.name)
+
+        createLogger("WorkingDirectoryTest", "ERROR")
+
+        self.assertTrue((Path(directory.name) / "Logs" / "WorkingDirectoryTest").is_dir())
+
+
+if __name__ == "__main__":
+    main()
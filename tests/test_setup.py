@@ -0,0 +1,60 @@
+"""
+Tests for the quickstart script.
+"""
+# Standard Library Imports
+from atexit import unregister as unregisterExitHandler
+from os import chdir, getcwd
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from unittest import TestCase, main
+
+# Internal imports
+from internals.database import Database
+from setup import main as runSetup
+
+
+class SetupTests(TestCase):
+    """
+    Runs the quickstart script in a temporary directory.
+    """
+
+    def setUp(self) -> None:
+        """
+        Moves into a temporary directory for the quickstart script to set up.
+        """
+        directory: TemporaryDirectory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.addCleanup(chdir, getcwd())
+        chdir(directory.name)
+
+    def test_createsProject(self) -> None:
+        """
+        The quickstart script creates the directories, database, and config file.
+        """
+        runSetup()
+
+        self.assertTrue(Path("Logs").is_dir())
+        self.assertTrue(Path("BotData/database.db").is_file())
+        self.assertTrue(Path("BotData/config.json").is_file())
+
+    def test_runningAgainKeepsData(self) -> None:
+        """
+        Running the quickstart script on an existing project leaves its data and config as they are.
+        """
+        runSetup()
+        Path("BotData/config.json").write_text("{}")
+
+        database: Database = Database(SimpleNamespace(loggingLevel="ERROR", owonerId=[]))
+        unregisterExitHandler(database.close)
+        self.addCleanup(database.close)
+        database.addUser(1, "user")
+
+        runSetup()
+
+        self.assertEqual(database.getUserName(1), "user")
+        self.assertEqual(Path("BotData/config.json").read_text(), "{}")
+
+
+if __name__ == "__main__":
+    main()